@@ -5,7 +5,7 @@ Crea una animación del espacio fase (θ, θ̇) mostrando la evolución temporal
 de todas las partículas.
 
 La animación muestra:
-- Trayectorias pasadas (líneas desvanecidas)
+- Trayectorias pasadas (rastro sólido delgado)
 - Posiciones actuales (puntos grandes)
 - Colisiones (flash rojo)
 
@@ -20,6 +20,7 @@ Ejemplo:
     julia --project=. animar_espacio_fase.jl results/simulation_20251111_004024/ 30
 """
 
+ENV["GKSwstype"] = "100"
 using Plots
 using DelimitedFiles
 using Printf
@@ -92,22 +93,15 @@ println()
 # ============================================================================
 println("📊 Organizando datos por frame...")
 
-# Crear estructura para cada frame
-frames_data = Dict{Float64, Dict{Int, Tuple{Float64, Float64}}}()
+# Crear estructura para cada frame: una sola pasada por las filas del CSV
+# (antes se construían dos máscaras de longitud total por cada (t, id))
+frames_data = Dict{Float64, Dict{Int, Tuple{Float64, Float64}}}(
+    t => Dict{Int, Tuple{Float64, Float64}}() for t in unique_times
+)
 
-for t in unique_times
-    mask = time_all .== t
-    frame_data = Dict{Int, Tuple{Float64, Float64}}()
-
-    for id in unique_ids
-        id_mask = mask .& (particle_id .== id)
-        if any(id_mask)
-            idx = findfirst(id_mask)
-            frame_data[id] = (theta_all[idx], theta_dot_all[idx])
-        end
-    end
-
-    frames_data[t] = frame_data
+for row in eachindex(time_all)
+    # Se conserva la primera fila de cada (t, id), como findfirst
+    get!(frames_data[time_all[row]], particle_id[row], (theta_all[row], theta_dot_all[row]))
 end
 
 println("  ✅ $(length(frames_data)) frames organizados")
@@ -182,35 +176,31 @@ anim = @animate for (frame_idx, t) in enumerate(times_to_animate)
             θ_hist = [pos[1] for pos in past_positions]
             θ̇_hist = [pos[2] for pos in past_positions]
 
-            # Dibujar trayectoria con alpha decreciente
-            for i in 1:(length(θ_hist)-1)
-                alpha_val = i / length(θ_hist) * 0.6
-                plot!(p, θ_hist[i:i+1], θ̇_hist[i:i+1],
-                      linewidth = 2,
-                      color = colores[idx],
-                      alpha = alpha_val,
-                      label = "")
-            end
+            # Dibujar trayectoria como una sola línea sólida y delgada (sin
+            # alpha: evita un segmento semitransparente por punto del rastro)
+            plot!(p, θ_hist, θ̇_hist,
+                  linewidth = 1,
+                  color = colores[idx],
+                  label = "")
         end
     end
 
-    # Dibujar posiciones actuales
-    for (idx, id) in enumerate(unique_ids)
-        if haskey(frames_data, t) && haskey(frames_data[t], id)
-            θ_current, θ̇_current = frames_data[t][id]
-
-            marker_color = has_collision ? :red : colores[idx]
-            marker_size = has_collision ? 12 : 8
-
-            scatter!(p, [θ_current], [θ̇_current],
-                     marker = :circle,
-                     markersize = marker_size,
-                     color = marker_color,
-                     markerstrokewidth = 2,
-                     markerstrokecolor = :white,
-                     alpha = 0.9,
-                     label = "")
-        end
+    # Dibujar posiciones actuales (una sola serie para todas las partículas)
+    if haskey(frames_data, t)
+        snapshot = frames_data[t]
+        presentes = [idx for (idx, id) in enumerate(unique_ids) if haskey(snapshot, id)]
+        θ_current = [snapshot[unique_ids[idx]][1] for idx in presentes]
+        θ̇_current = [snapshot[unique_ids[idx]][2] for idx in presentes]
+        marker_colors = has_collision ? :red : [colores[idx] for idx in presentes]
+
+        scatter!(p, θ_current, θ̇_current,
+                 marker = :circle,
+                 markersize = has_collision ? 12 : 8,
+                 markercolor = marker_colors,
+                 markerstrokewidth = 2,
+                 markerstrokecolor = :white,
+                 alpha = 0.9,
+                 label = "")
     end
 
     # Añadir texto de colisión si hay
@@ -239,6 +229,9 @@ archivo_gif = joinpath(dir_resultados, "espacio_fase_animacion.gif")
 try
     gif(anim, archivo_gif, fps=fps)
     println("  ✅ Guardado: espacio_fase_animacion.gif")
+
+    # Los frames PNG intermedios ya están codificados: liberar el disco ahora
+    rm(anim.dir; recursive=true, force=true)
     println()
     println("="^80)
     println("✅ ANIMACIÓN COMPLETADA")
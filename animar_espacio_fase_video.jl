@@ -26,6 +26,7 @@ Argumentos opcionales:
     trail_length : Longitud del rastro en puntos (default: 50)
 """
 
+ENV["GKSwstype"] = "100"
 using Plots
 using DelimitedFiles
 using Printf
@@ -141,12 +142,19 @@ println("🔄 Desenrollando ángulos...")
 
 trayectorias = Dict{Int, NamedTuple}()
 
+# Filas de cada partícula agrupadas en una sola pasada (en lugar de una
+# máscara completa por partícula)
+filas_por_particula = Dict(id => Int[] for id in unique_ids)
+for (fila, id) in enumerate(particle_id)
+    push!(filas_por_particula[id], fila)
+end
+
 for id in unique_ids
-    mask = particle_id .== id
+    filas = filas_por_particula[id]
 
-    t_part = time_all[mask]
-    θ_part_wrapped = theta_wrapped[mask]
-    θ̇_part = theta_dot_all[mask]
+    t_part = time_all[filas]
+    θ_part_wrapped = theta_wrapped[filas]
+    θ̇_part = theta_dot_all[filas]
 
     # Desenrollar
     θ_part_unwrapped = unwrap_angles(θ_part_wrapped)
@@ -222,14 +230,11 @@ println("  Total de frames: $n_frames")
 println("  Duración del video: $(n_frames/fps) segundos")
 println()
 
-# Calcular límites del espacio fase
-θ_unwrapped_all = vcat([trayectorias[id].theta for id in unique_ids]...)
-θ̇_all = theta_dot_all
-
-θ_min = minimum(θ_unwrapped_all)
-θ_max = maximum(θ_unwrapped_all)
-θ̇_min = minimum(θ̇_all)
-θ̇_max = maximum(θ̇_all)
+# Calcular límites del espacio fase (extremos por partícula, sin concatenar
+# todas las trayectorias)
+θ_min = minimum(minimum(trayectorias[id].theta) for id in unique_ids)
+θ_max = maximum(maximum(trayectorias[id].theta) for id in unique_ids)
+θ̇_min, θ̇_max = extrema(theta_dot_all)
 
 # Añadir margen 5%
 θ_range = θ_max - θ_min
@@ -241,6 +246,22 @@ ylims_val = (θ̇_min - 0.05*θ̇_range, θ̇_max + 0.05*θ̇_range)
 # Paleta de colores
 colores = palette(:tab10, n_particles)
 
+# Índice de cada frame en la trayectoria de cada partícula (0 si la partícula
+# no tiene dato en ese tiempo), calculado una sola vez en lugar de buscar el
+# tiempo más cercano en cada frame
+frame_of_time = Dict(t => k for (k, t) in enumerate(unique_times))
+indices_por_frame = Dict{Int, Vector{Int}}()
+for id in unique_ids
+    idx_frame = zeros(Int, n_frames)
+    for (k, t) in enumerate(trayectorias[id].time)
+        f = frame_of_time[t]
+        if idx_frame[f] == 0
+            idx_frame[f] = k
+        end
+    end
+    indices_por_frame[id] = idx_frame
+end
+
 # ============================================================================
 # Función para detectar colisión en tiempo dado
 # ============================================================================
@@ -279,15 +300,13 @@ anim = @animate for (frame_idx, t) in enumerate(unique_times)
         dpi = 150
     )
 
-    # Marcar líneas de 2π
-    for θ_2pi in multiples_2pi
-        vline!(p, [θ_2pi],
-               linestyle = :dash,
-               color = :gray,
-               alpha = 0.2,
-               linewidth = 1,
-               label = "")
-    end
+    # Marcar líneas de 2π (todas en una sola serie)
+    vline!(p, multiples_2pi,
+           linestyle = :dash,
+           color = :gray,
+           alpha = 0.2,
+           linewidth = 1,
+           label = "")
 
     # Detectar si hay colisión en este frame
     is_collision_frame = collision_at_time(t, collision_times, 0.01)
@@ -296,12 +315,9 @@ anim = @animate for (frame_idx, t) in enumerate(unique_times)
     for (idx, id) in enumerate(unique_ids)
         traj = trayectorias[id]
 
-        # Encontrar índice más cercano al tiempo actual
-        time_diffs = abs.(traj.time .- t)
-        current_idx = argmin(time_diffs)
-
-        # Si el tiempo no coincide exactamente, skip
-        if time_diffs[current_idx] > 1e-6
+        # Índice precalculado; si la partícula no tiene dato en este tiempo, skip
+        current_idx = indices_por_frame[id][frame_idx]
+        if current_idx == 0
             continue
         end
 
@@ -311,8 +327,8 @@ anim = @animate for (frame_idx, t) in enumerate(unique_times)
 
         # Graficar rastro desvaneciente
         if end_idx > start_idx
-            θ_trail = traj.theta[start_idx:end_idx]
-            θ̇_trail = traj.theta_dot[start_idx:end_idx]
+            θ_trail = @view traj.theta[start_idx:end_idx]
+            θ̇_trail = @view traj.theta_dot[start_idx:end_idx]
 
             # Calcular alphas desvanecientes
             n_trail_points = length(θ_trail)
@@ -385,6 +401,10 @@ try
     mp4(anim, archivo_mp4, fps=fps)
     println("  ✅ espacio_fase_unwrapped_animacion.mp4")
 
+    # Los frames PNG intermedios ya están codificados: liberar el disco ahora
+    # en lugar de retenerlos hasta que termine el proceso
+    rm(anim.dir; recursive=true, force=true)
+
     # Obtener tamaño del archivo
     filesize_mb = stat(archivo_mp4).size / (1024^2)
     println()
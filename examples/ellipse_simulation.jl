@@ -48,8 +48,10 @@ save_every = 100
 # Método de colisión
 collision_method = :parallel_transport  # :simple, :parallel_transport, :geodesic
 
-# Semilla para reproducibilidad
-Random.seed!(1234)
+# Semilla para reproducibilidad: un único generador explícito (Xoshiro256++,
+# el RNG por defecto de Julia) que se reutiliza en toda la inicialización
+seed = 1234
+rng = Xoshiro(seed)
 
 println("\n📋 PARÁMETROS:")
 println("━" ^ 70)
@@ -79,7 +81,7 @@ particles_initial = generate_random_particles(
     a,
     b;
     θ_dot_range=θ_dot_range,
-    rng=MersenneTwister(1234)
+    rng=rng
 )
 
 println("✅ Partículas generadas exitosamente")
@@ -7,9 +7,6 @@ Usage:
     julia --project=. poster/generate_figures.jl
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CairoMakie
 using ColorSchemes
 using LaTeXStrings
@@ -45,6 +42,11 @@ update_theme!(
 const OUTDIR = "poster/figures"
 mkpath(OUTDIR)
 
+# Rasterization of bulk data (long trajectories, many markers) in the PDFs:
+# an Int is the resolution scale factor; set to `false` for fully vector output.
+# Axes, labels and text always stay vector.
+const RASTERIZE_BULK = 4
+
 # Color scheme for consistency
 const COLORS = ColorSchemes.seaborn_colorblind
 const COLOR_MEASURED = COLORS[1]      # Blue
@@ -74,24 +76,34 @@ function figure1_system_schematic()
         aspect = DataAspect(),
     )
 
-    # Draw ellipse colored by curvature
+    # One φ grid shared by both panels: the outline, κ and g are all
+    # evaluated once on it
     φ_range = range(0, 2π, length=500)
-    x_ellipse = [a * cos(φ) for φ in φ_range]
-    y_ellipse = [b * sin(φ) for φ in φ_range]
-
-    # Curvature for coloring
-    g_φφ(φ) = a^2 * sin(φ)^2 + b^2 * cos(φ)^2
-    κ(φ) = a * b / g_φφ(φ)^1.5
-    κ_vals = [κ(φ) for φ in φ_range]
-    κ_normalized = (κ_vals .- minimum(κ_vals)) ./ (maximum(κ_vals) - minimum(κ_vals))
-
-    # Draw ellipse as colored segments
-    for i in 1:(length(φ_range)-1)
-        lines!(ax1, x_ellipse[i:i+1], y_ellipse[i:i+1],
-            color = ColorSchemes.viridis[κ_normalized[i]],
-            linewidth = 8)
+    n_φ = length(φ_range)
+    x_ellipse = Vector{Float64}(undef, n_φ)
+    y_ellipse = Vector{Float64}(undef, n_φ)
+    g_vals = Vector{Float64}(undef, n_φ)
+    κ_vals = Vector{Float64}(undef, n_φ)
+    for (i, φ) in enumerate(φ_range)
+        s, c = sincos(φ)
+        x_ellipse[i] = a * c
+        y_ellipse[i] = b * s
+        g_vals[i] = a^2 * s^2 + b^2 * c^2
+        κ_vals[i] = a * b / g_vals[i]^1.5
     end
 
+    # Draw ellipse colored by curvature as a single line. The outline is
+    # thinned to at most `max_segments` segments (finer detail is invisible at
+    # this size); the metric panel below keeps the full grid.
+    max_segments = 256
+    stride = max(1, cld(n_φ - 1, max_segments))
+    outline = unique([1:stride:n_φ; n_φ])
+    lines!(ax1, x_ellipse[outline], y_ellipse[outline],
+        color = κ_vals[outline],
+        colormap = :viridis,
+        colorrange = extrema(κ_vals),
+        linewidth = 8)
+
     # Add particles at cluster locations (φ ≈ 0 and φ ≈ π)
     n_particles_cluster1 = 18
     n_particles_cluster2 = 16
@@ -140,11 +152,8 @@ function figure1_system_schematic()
         title = "Metric Tensor Component",
     )
 
-    φ_plot = range(0, 2π, length=200)
-    g_vals = [g_φφ(φ) for φ in φ_plot]
-
-    lines!(ax2, φ_plot, g_vals, color = :black, linewidth = 3)
-    band!(ax2, φ_plot, zeros(length(φ_plot)), g_vals, color = (:blue, 0.2))
+    lines!(ax2, φ_range, g_vals, color = :black, linewidth = 3)
+    band!(ax2, φ_range, zeros(n_φ), g_vals, color = (:blue, 0.2))
 
     # Mark poles
     vlines!(ax2, [0, π, 2π], color = :red, linestyle = :dash, linewidth = 2)
@@ -206,8 +215,8 @@ function figure2_order_parameters()
             n_times, N = size(phi)
         end
 
-        ψ_t = [abs(mean(exp.(im .* phi[t, :]))) for t in 1:n_times]
-        S_t = [abs(mean(exp.(2im .* phi[t, :]))) for t in 1:n_times]
+        ψ_t = [abs(mean(cis, @view phi[t, :])) for t in 1:n_times]
+        S_t = [abs(mean(φ -> cis(2φ), @view phi[t, :])) for t in 1:n_times]
 
         return times, ψ_t, S_t
     end
@@ -224,10 +233,13 @@ function figure2_order_parameters()
     step = max(1, length(times) ÷ 1000)
     idx = 1:step:length(times)
 
+    # Up to ~1000 vertices per noisy trajectory: rasterized in the PDF
     lines!(ax, times[idx], ψ_t[idx],
-        color = COLOR_MEASURED, linewidth = 2, label = L"\psi = |⟨e^{i\phi}⟩|  \; (\mathrm{polar})")
+        color = COLOR_MEASURED, linewidth = 2, rasterize = RASTERIZE_BULK,
+        label = L"\psi = |⟨e^{i\phi}⟩|  \; (\mathrm{polar})")
     lines!(ax, times[idx], S_t[idx],
-        color = COLOR_PREDICTED, linewidth = 2, label = L"S = |⟨e^{2i\phi}⟩| \; (\mathrm{nematic})")
+        color = COLOR_PREDICTED, linewidth = 2, rasterize = RASTERIZE_BULK,
+        label = L"S = |⟨e^{2i\phi}⟩| \; (\mathrm{nematic})")
 
     # Threshold lines
     hlines!(ax, [0.3], color = COLOR_MEASURED, linestyle = :dash, linewidth = 1.5, alpha = 0.5)
@@ -248,9 +260,11 @@ function figure2_order_parameters()
         aspect = 1,
     )
 
+    # Up to ~500 translucent markers: rasterize them in the PDF instead of
+    # emitting one vector path per point (axes, labels and text stay vector)
     scatter!(ax2, ψ_t[idx], S_t[idx],
         color = times[idx], colormap = :viridis,
-        markersize = 4, alpha = 0.5)
+        markersize = 4, alpha = 0.5, rasterize = RASTERIZE_BULK)
 
     # Reference lines
     lines!(ax2, [0, 1], [0, 1], color = :gray, linestyle = :dash, linewidth = 2)
@@ -503,29 +517,34 @@ function figure5_mechanism()
     lines!(ax1, x_ellipse, y_ellipse, color = :black, linewidth = 4)
 
     # Draw velocity arrows (larger at low κ, smaller at high κ)
+    # All arrows are computed first and drawn with a single arrows! call
     φ_arrows = [0, π/4, π/2, 3π/4, π, 5π/4, 3π/2, 7π/4]
-    for φ in φ_arrows
-        x = a * cos(φ)
-        y = b * sin(φ)
+    n_arrows = length(φ_arrows)
+    xs, ys = zeros(n_arrows), zeros(n_arrows)
+    us, vs = zeros(n_arrows), zeros(n_arrows)
+    arrow_colors = Vector{Symbol}(undef, n_arrows)
+
+    for (i, φ) in enumerate(φ_arrows)
+        s, c = sincos(φ)
+        xs[i] = a * c
+        ys[i] = b * s
 
-        # Tangent direction
-        dx = -a * sin(φ)
-        dy = b * cos(φ)
-        norm = sqrt(dx^2 + dy^2)
-        dx /= norm
-        dy /= norm
+        # Tangent direction (|tangent|² = g_φφ)
+        g_φφ = a^2 * s^2 + b^2 * c^2
+        norm = sqrt(g_φφ)
 
         # Arrow length proportional to 1/κ (velocity)
-        g_φφ = a^2 * sin(φ)^2 + b^2 * cos(φ)^2
         κ = a * b / g_φφ^1.5
         arrow_len = 0.5 / κ  # Inverse of curvature
 
-        color = κ > 1.5 ? :red : :blue
-
-        arrows!(ax1, [x], [y], [dx * arrow_len], [dy * arrow_len],
-            color = color, linewidth = 3, arrowsize = 15)
+        us[i] = -a * s / norm * arrow_len
+        vs[i] = b * c / norm * arrow_len
+        arrow_colors[i] = κ > 1.5 ? :red : :blue
     end
 
+    arrows!(ax1, xs, ys, us, vs,
+        color = arrow_colors, linewidth = 3, arrowsize = 15)
+
     # Labels
     text!(ax1, a + 0.1, 0, text = "SLOW\n(trapped)", color = :red, fontsize = 20, align = (:left, :center))
     text!(ax1, 0, b + 0.2, text = "FAST\n(escapes)", color = :blue, fontsize = 20, align = (:center, :bottom))
@@ -7,9 +7,6 @@ Usage:
     julia --project=. poster/generate_figures_v2.jl
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CairoMakie
 using ColorSchemes
 using LaTeXStrings
@@ -228,8 +225,8 @@ function figure3_order_parameters()
                 phi = phi'
                 n_times, N = size(phi)
             end
-            ψ_t = [abs(mean(exp.(im .* phi[t, :]))) for t in 1:n_times]
-            S_t = [abs(mean(exp.(2im .* phi[t, :]))) for t in 1:n_times]
+            ψ_t = [abs(mean(cis, @view phi[t, :])) for t in 1:n_times]
+            S_t = [abs(mean(φ -> cis(2φ), @view phi[t, :])) for t in 1:n_times]
             return times, ψ_t, S_t
         end
 
@@ -555,8 +552,8 @@ function figure_poster_combined()
             times = read(fid, "trajectories/time")
             phi = read(fid, "trajectories/phi")
             if size(phi, 1) == length(times); n_times, N = size(phi); else phi = phi'; n_times, N = size(phi); end
-            ψ_t = [abs(mean(exp.(im .* phi[t, :]))) for t in 1:n_times]
-            S_t = [abs(mean(exp.(2im .* phi[t, :]))) for t in 1:n_times]
+            ψ_t = [abs(mean(cis, @view phi[t, :])) for t in 1:n_times]
+            S_t = [abs(mean(φ -> cis(2φ), @view phi[t, :])) for t in 1:n_times]
             return times, ψ_t, S_t
         end
         step = max(1, length(times) ÷ 300)
@@ -7,9 +7,6 @@ Usage:
     julia --project=. poster/generate_figures_v3.jl
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CairoMakie
 using ColorSchemes
 using LaTeXStrings
@@ -198,8 +195,8 @@ function figure3_order_parameters()
                 phi = phi'
                 n_times, N = size(phi)
             end
-            ψ_t = [abs(mean(exp.(im .* phi[t, :]))) for t in 1:n_times]
-            S_t = [abs(mean(exp.(2im .* phi[t, :]))) for t in 1:n_times]
+            ψ_t = [abs(mean(cis, @view phi[t, :])) for t in 1:n_times]
+            S_t = [abs(mean(φ -> cis(2φ), @view phi[t, :])) for t in 1:n_times]
             return times, ψ_t, S_t
         end
 
@@ -401,17 +398,13 @@ function figure6_energy_conservation()
 
             a, b = 2.0, 0.872
 
-            # Compute total kinetic energy at each time
-            E_t = Float64[]
-            for t in 1:n_times
-                E = 0.0
-                for p in 1:N
-                    φ = phi[t, p]
-                    φ̇ = phidot[t, p]
-                    g_φφ = a^2 * sin(φ)^2 + b^2 * cos(φ)^2
-                    E += 0.5 * g_φφ * φ̇^2
-                end
-                push!(E_t, E)
+            # Compute total kinetic energy at each time (preallocated, one
+            # sincos per sample)
+            E_t = zeros(n_times)
+            for p in 1:N, t in 1:n_times
+                s, c = sincos(phi[t, p])
+                g_φφ = a^2 * s^2 + b^2 * c^2
+                E_t[t] += 0.5 * g_φφ * phidot[t, p]^2
             end
 
             E0 = E_t[1]
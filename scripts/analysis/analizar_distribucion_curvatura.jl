@@ -9,6 +9,7 @@ Verifica si las partículas tienden a acumularse en regiones de mayor curvatura.
 using JLD2
 using Statistics
 using Printf
+ENV["GKSwstype"] = "100"
 using Plots
 using DataFrames
 using CSV
@@ -9,6 +9,7 @@ Uso:
 
 using DelimitedFiles
 using Printf
+ENV["GKSwstype"] = "100"
 using Plots
 
 if length(ARGS) < 1
@@ -10,6 +10,7 @@ Uso:
     julia --project=. analizar_espacio_fase.jl results/simulation_XXXXXX/
 """
 
+ENV["GKSwstype"] = "100"
 using Plots
 using DelimitedFiles
 using Printf
@@ -56,6 +57,11 @@ n_total_points = length(time)
 unique_ids = sort(unique(particle_id))
 n_particles = length(unique_ids)
 
+# Etiquetas por partícula en la leyenda sólo si sigue siendo legible; con
+# muchas partículas se omiten y la leyenda conserva sólo las demás entradas
+const MAX_LEGEND_ENTRIES = 10
+etiqueta_particula(id) = n_particles <= MAX_LEGEND_ENTRIES ? "Partícula $id" : ""
+
 println("  ✅ $(n_total_points) puntos cargados")
 println("  ✅ $(n_particles) partículas")
 println()
@@ -136,29 +142,29 @@ p1 = plot(
 # Paleta de colores
 colores = palette(:tab10, n_particles)
 
-# Graficar cada partícula
-for (idx, id) in enumerate(unique_ids)
-    traj = trayectorias[id]
-    plot!(p1, traj.theta, traj.theta_dot,
-          label = "Partícula $id",
-          linewidth = 1.5,
-          color = colores[idx],
-          alpha = 0.7)
-
-    # Marcar inicio con círculo
-    scatter!(p1, [traj.theta[1]], [traj.theta_dot[1]],
-             marker = :circle,
-             markersize = 6,
-             color = colores[idx],
-             label = "")
-
-    # Marcar final con cuadrado
-    scatter!(p1, [traj.theta[end]], [traj.theta_dot[end]],
-             marker = :square,
-             markersize = 6,
-             color = colores[idx],
-             label = "")
-end
+# Graficar todas las partículas en una sola llamada (una serie por partícula,
+# para conservar la leyenda)
+trajs = [trayectorias[id] for id in unique_ids]
+colores_part = [colores[idx] for idx in eachindex(unique_ids)]
+plot!(p1, [traj.theta for traj in trajs], [traj.theta_dot for traj in trajs],
+      label = permutedims([etiqueta_particula(id) for id in unique_ids]),
+      linewidth = 1.5,
+      color = permutedims(colores_part),
+      alpha = 0.7)
+
+# Marcar inicio con círculo (una sola serie para todas las partículas)
+scatter!(p1, [traj.theta[1] for traj in trajs], [traj.theta_dot[1] for traj in trajs],
+         marker = :circle,
+         markersize = 6,
+         markercolor = colores_part,
+         label = "")
+
+# Marcar final con cuadrado
+scatter!(p1, [traj.theta[end] for traj in trajs], [traj.theta_dot[end] for traj in trajs],
+         marker = :square,
+         markersize = 6,
+         markercolor = colores_part,
+         label = "")
 
 savefig(p1, joinpath(dir_resultados, "espacio_fase_completo.png"))
 println("  ✅ espacio_fase_completo.png")
@@ -182,7 +188,7 @@ if n_collisions > 0
     for (idx, id) in enumerate(unique_ids)
         traj = trayectorias[id]
         plot!(p2, traj.theta, traj.theta_dot,
-              label = "Partícula $id",
+              label = etiqueta_particula(id),
               linewidth = 1.5,
               color = colores[idx],
               alpha = 0.6)
@@ -336,7 +342,7 @@ plot!(p4, [NaN], [NaN],
 for (idx, id) in enumerate(unique_ids)
     traj = trayectorias[id]
     plot!(p4, traj.theta, traj.theta_dot,
-          label = "Partícula $id",
+          label = etiqueta_particula(id),
           linewidth = 2,
           color = colores[idx],
           alpha = 0.8)
@@ -20,6 +20,7 @@ Uso:
     julia --project=. analizar_espacio_fase_unwrapped.jl results/simulation_XXXXXX/
 """
 
+ENV["GKSwstype"] = "100"
 using Plots
 using DelimitedFiles
 using Printf
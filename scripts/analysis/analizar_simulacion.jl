@@ -12,12 +12,10 @@ Genera:
     - Análisis de colisiones
 """
 
-using Pkg
-Pkg.activate(".")
-
 using DelimitedFiles
 using Statistics
 using Printf
+ENV["GKSwstype"] = "100"
 using Plots  # Usaremos Plots.jl para visualización
 
 # ============================================================================
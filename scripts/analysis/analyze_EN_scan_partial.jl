@@ -9,9 +9,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_EN_scan_partial.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
@@ -9,9 +9,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_cluster_formation_time.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using HDF5
 using Statistics
 using Printf
@@ -23,6 +23,7 @@ using JSON
 using Statistics
 using DataFrames
 using CSV
+ENV["GKSwstype"] = "100"
 using Plots
 using Printf
 
@@ -14,9 +14,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_clustering_proper.jl <h5_file> [output_dir]
 """
 
-using Pkg
-Pkg.activate(".")
-
 using HDF5
 using Statistics
 using LinearAlgebra
@@ -123,14 +120,20 @@ function angular_dbscan(φ::Vector{Float64}; eps=0.4, min_pts=2)
     labels = zeros(Int, N)  # 0=unvisited, -1=noise, >0=cluster
     cluster_id = 0
 
-    function neighbors(i)
-        [j for j in 1:N if j != i && angular_dist(φ[i], φ[j]) < eps]
+    # Neighbour lists from one pass over the pairs i < j: no j ≠ i test, and
+    # each distance is evaluated once instead of on every expansion of i and j
+    neighbors = [Int[] for _ in 1:N]
+    for i in 1:N, j in (i+1):N
+        if angular_dist(φ[i], φ[j]) < eps
+            push!(neighbors[i], j)
+            push!(neighbors[j], i)
+        end
     end
 
     for i in 1:N
         labels[i] != 0 && continue
 
-        nbrs = neighbors(i)
+        nbrs = neighbors[i]
 
         if length(nbrs) < min_pts
             labels[i] = -1  # Noise
@@ -147,7 +150,7 @@ function angular_dbscan(φ::Vector{Float64}; eps=0.4, min_pts=2)
             labels[j] != 0 && continue
             labels[j] = cluster_id
 
-            j_nbrs = neighbors(j)
+            j_nbrs = neighbors[j]
             length(j_nbrs) >= min_pts && union!(seeds, j_nbrs)
         end
     end
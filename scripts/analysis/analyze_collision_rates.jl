@@ -9,9 +9,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_collision_rates.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
@@ -17,6 +17,7 @@ using CSV
 using Printf
 using LinearAlgebra
 using Dates
+ENV["GKSwstype"] = "100"
 using Plots
 gr()  # Use GR backend
 
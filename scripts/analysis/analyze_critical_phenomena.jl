@@ -14,6 +14,7 @@ using HDF5
 using CSV
 using DataFrames
 using Statistics
+ENV["GKSwstype"] = "100"
 using Plots
 using Printf
 using LsqFit
@@ -14,9 +14,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_curvature_density.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
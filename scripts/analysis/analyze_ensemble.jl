@@ -13,6 +13,7 @@ using Statistics, StatsBase
 using CSV, DataFrames
 using JSON
 using HDF5
+ENV["GKSwstype"] = "100"
 using Plots
 using Interpolations
 
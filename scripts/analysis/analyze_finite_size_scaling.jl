@@ -16,6 +16,7 @@
 using CSV
 using DataFrames
 using Statistics
+ENV["GKSwstype"] = "100"
 using Plots
 using LsqFit
 using Printf
@@ -8,9 +8,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_fss_simple.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
@@ -19,12 +16,7 @@ using HDF5
 
 const PROJECT_ROOT = dirname(dirname(@__DIR__))
 include(joinpath(PROJECT_ROOT, "src", "io_hdf5.jl"))
-
-# ============================================================================
-# Order Parameters
-# ============================================================================
-
-order_param(phi) = abs(sum(exp(im * φ) for φ in phi) / length(phi))
+include(joinpath(PROJECT_ROOT, "src", "order_parameters.jl"))
 
 # ============================================================================
 # Analysis
@@ -43,14 +35,8 @@ function analyze_sim(h5_file)
     # Late-time (last 20%)
     start_idx = max(1, Int(round(0.8 * n_snap)))
 
-    psi_late = Float64[]
-    sigma_late = Float64[]
-
-    for i in start_idx:n_snap
-        phi = Vector{Float64}(result.phi[i, :])
-        push!(psi_late, order_param(phi))
-        push!(sigma_late, std(phi))
-    end
+    psi_late = order_parameter_series(view(result.phi, start_idx:n_snap, :))
+    sigma_late = [std(view(result.phi, i, :)) for i in start_idx:n_snap]
 
     return (
         N = N,
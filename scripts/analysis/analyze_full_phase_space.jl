@@ -26,11 +26,13 @@ using JSON
 using Statistics
 using DataFrames
 using CSV
+ENV["GKSwstype"] = "100"
 using Plots
 using Printf
 using LinearAlgebra
 
-include("src/geometry/metrics_polar.jl")
+const PROJECT_ROOT = dirname(dirname(@__DIR__))
+include(joinpath(PROJECT_ROOT, "src", "geometry", "metrics_polar.jl"))
 
 """
     load_full_trajectories(hdf5_file::String)
@@ -64,24 +66,15 @@ Compute local metric g_φφ(φ) for each particle position.
 The metric determines the "speed" at which angular velocity translates to tangential velocity:
 v_tangent = √g_φφ(φ) · φ̇
 
-For ellipse: g_φφ(φ) = a²sin²(φ) + b²cos²(φ)
+For ellipse: g_φφ(φ) = r² + (dr/dφ)² (see `metric_ellipse_polar`)
 
 Returns:
 - g_phi: metric values at each particle position
-- kappa: local curvature κ(φ) ∝ 1/√g_φφ (high curvature → slow region)
+- kappa: local curvature κ(φ) of the ellipse at each particle position
 """
 function compute_local_curvature_metric(phi::Vector{Float64}, a::Float64, b::Float64)
-    N = length(phi)
-    g_phi = zeros(N)
-    kappa = zeros(N)
-
-    for i in 1:N
-        g_phi[i] = metric_polar(phi[i], a, b)
-
-        # Curvature is inversely related to metric
-        # κ ∝ 1/√g_φφ (simplified - exact formula is more complex)
-        kappa[i] = 1.0 / sqrt(g_phi[i])
-    end
+    g_phi = metric_ellipse_polar.(phi, a, b)
+    kappa = curvatures_polar(phi, a, b)
 
     return g_phi, kappa
 end
@@ -331,15 +324,19 @@ function create_phase_space_evolution_data(t::Vector{Float64},
     sample_rate = max(1, n_snapshots ÷ 100)
     indices = 1:sample_rate:n_snapshots
 
+    # Physical speeds and curvatures for every sample in one vectorized pass
+    v_all = physical_speeds_polar(phi, phidot, a, b)
+    kappa_all = curvatures_polar(phi, a, b)
+
     # Create DataFrame with all data
     data = DataFrame()
 
     for (idx_count, idx) in enumerate(indices)
         for i in 1:N
             # Compute local metric and curvature
-            g = metric_polar(phi[i, idx], a, b)
-            kappa = 1.0 / sqrt(g)
-            v_tangent = sqrt(g) * abs(phidot[i, idx])
+            g = metric_ellipse_polar(phi[i, idx], a, b)
+            kappa = kappa_all[i, idx]
+            v_tangent = v_all[i, idx]
 
             push!(data, (
                 time = t[idx],
@@ -418,8 +415,8 @@ function analyze_clustering_mechanism_geometry(hdf5_file::String)
 
     # Plot metric variation around ellipse
     phi_samples = range(0, 2π, length=200)
-    g_samples = [metric_polar(p, a, b) for p in phi_samples]
-    kappa_samples = 1.0 ./ sqrt.(g_samples)
+    g_samples = metric_ellipse_polar.(phi_samples, a, b)
+    kappa_samples = curvatures_polar(phi_samples, a, b)
 
     # Normalize curvature for visualization
     kappa_norm = (kappa_samples .- minimum(kappa_samples)) ./ (maximum(kappa_samples) - minimum(kappa_samples))
@@ -471,7 +468,7 @@ function analyze_trajectory_by_curvature(t, phi, phidot, a, b, output_dir)
 
     # Define curvature threshold
     phi_samples = range(0, 2π, length=200)
-    kappa_samples = [1.0/sqrt(metric_polar(p, a, b)) for p in phi_samples]
+    kappa_samples = curvatures_polar(phi_samples, a, b)
     kappa_threshold = median(kappa_samples)
 
     # Count particles in high curvature regions over time
@@ -479,6 +476,10 @@ function analyze_trajectory_by_curvature(t, phi, phidot, a, b, output_dir)
     mean_v_high = zeros(n_snapshots)
     mean_v_low = zeros(n_snapshots)
 
+    # Curvature and physical speed for all samples, computed once
+    kappa_all = curvatures_polar(phi, a, b)
+    v_all = physical_speeds_polar(phi, phidot, a, b)
+
     for idx in 1:n_snapshots
         n_h = 0
         sum_v_h = 0.0
@@ -486,11 +487,9 @@ function analyze_trajectory_by_curvature(t, phi, phidot, a, b, output_dir)
         n_l = 0
 
         for i in 1:N
-            g = metric_polar(phi[i, idx], a, b)
-            kappa = 1.0 / sqrt(g)
-            v = sqrt(g) * abs(phidot[i, idx])
+            v = v_all[i, idx]
 
-            if kappa > kappa_threshold
+            if kappa_all[i, idx] > kappa_threshold
                 n_h += 1
                 sum_v_h += v
             else
@@ -42,16 +42,28 @@ end
 """
 Factor de estructura S(k) con énfasis en k→0
 S(0) ~ χ_T (compresibilidad)
+
+S(k) = |Σⱼ e^{ikφⱼ}|²/N es la suma de pares Σᵢⱼ cos(k(φᵢ - φⱼ))/N reducida a
+una sola suma. Se evalúa un `sincos` por partícula y los armónicos k > 1 se
+obtienen por recurrencia de suma de ángulos (cos/sin de (k-1)φ + φ), sin
+temporales por k.
 """
 function structure_factor_full(φ::Vector{Float64}; k_max::Int=30)
     N = length(φ)
-    S_k = zeros(k_max)
-    for k in 1:k_max
-        sum_cos = sum(cos.(k .* φ))
-        sum_sin = sum(sin.(k .* φ))
-        S_k[k] = (sum_cos^2 + sum_sin^2) / N
+    sum_cos = zeros(k_max)
+    sum_sin = zeros(k_max)
+
+    @inbounds for j in 1:N
+        s1, c1 = sincos(φ[j])
+        ck, sk = c1, s1
+        for k in 1:k_max
+            sum_cos[k] += ck
+            sum_sin[k] += sk
+            ck, sk = ck * c1 - sk * s1, sk * c1 + ck * s1
+        end
     end
-    return S_k
+
+    return (sum_cos .^ 2 .+ sum_sin .^ 2) ./ N
 end
 
 """
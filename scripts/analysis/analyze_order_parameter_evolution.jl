@@ -6,12 +6,9 @@ Analyzes how σ_φ (spatial spread) and Ψ (orientational order) evolve over tim
 to understand clustering dynamics and identify transient phenomena.
 
 Usage:
-    julia --project=. scripts/analysis/analyze_order_parameter_evolution.jl <campaign_dir>
+    julia --project=. -t auto scripts/analysis/analyze_order_parameter_evolution.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
@@ -21,20 +18,12 @@ using HDF5
 # Include HDF5 loader
 const PROJECT_ROOT = dirname(dirname(@__DIR__))
 include(joinpath(PROJECT_ROOT, "src", "io_hdf5.jl"))
+include(joinpath(PROJECT_ROOT, "src", "order_parameters.jl"))
 
 # ============================================================================
 # Order Parameter Calculations
 # ============================================================================
 
-"""
-Calculate orientational order parameter Ψ = |⟨e^{iφ}⟩|
-"""
-function order_parameter(phi::Vector{Float64})
-    N = length(phi)
-    N == 0 && return 0.0
-    return abs(sum(exp(im * φ) for φ in phi) / N)
-end
-
 """
 Calculate circular standard deviation
 """
@@ -102,13 +91,16 @@ function analyze_time_evolution(h5_file::String)
     # Calculate order parameters at each time
     times = result.times
     sigma_phi = zeros(n_snapshots)
-    psi = zeros(n_snapshots)
     n_clusters = zeros(Int, n_snapshots)
 
+    psi = order_parameter_series(result.phi)
+
+    # (N, n_snapshots): each snapshot is a contiguous column
+    phi_by_snapshot = Matrix{Float64}(permutedims(result.phi))
+
     for i in 1:n_snapshots
-        phi = Vector{Float64}(result.phi[i, :])
+        phi = phi_by_snapshot[:, i]
         sigma_phi[i] = std(phi)
-        psi[i] = order_parameter(phi)
         n_clusters[i] = count_clusters(phi)
     end
 
@@ -253,10 +245,13 @@ function main()
     println("Found $(length(sim_dirs)) simulations")
     println()
 
-    # Analyze each simulation
-    results = DataFrame()
+    # Analyze each simulation. Runs are independent, so they are spread over
+    # threads (julia -t N); rows are stored by index to keep the input order
+    rows = Vector{Union{Nothing, Dict{String, Any}}}(nothing, length(sim_dirs))
+    n_processed = Threads.Atomic{Int}(0)
 
-    for (i, sim_dir) in enumerate(sim_dirs)
+    Threads.@threads for i in eachindex(sim_dirs)
+        sim_dir = sim_dirs[i]
         h5_file = joinpath(campaign_dir, sim_dir, "trajectories.h5")
         params = extract_params(sim_dir)
 
@@ -269,14 +264,20 @@ function main()
             merge!(row, params)
             merge!(row, metrics)
 
-            push!(results, row; cols=:union)
+            rows[i] = row
         end
 
-        if i % 20 == 0
-            println("  Processed $i / $(length(sim_dirs))")
+        done = Threads.atomic_add!(n_processed, 1) + 1
+        if done % 20 == 0
+            println("  Processed $done / $(length(sim_dirs))")
         end
     end
 
+    results = DataFrame()
+    for row in rows
+        row === nothing || push!(results, row; cols=:union)
+    end
+
     println()
     println("Analyzed $(nrow(results)) simulations")
 
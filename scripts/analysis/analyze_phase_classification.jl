@@ -33,6 +33,7 @@ using Dates
 # Include HDF5 loader (relative to project root)
 const PROJECT_ROOT = dirname(dirname(@__DIR__))
 include(joinpath(PROJECT_ROOT, "src", "io_hdf5.jl"))
+include(joinpath(PROJECT_ROOT, "src", "order_parameters.jl"))
 
 # ============================================================================
 # Phase Classification Criteria
@@ -143,13 +144,8 @@ Calculate orientational order parameter Ψ = |⟨e^{iφ}⟩|.
 Ψ = 1 means all particles at same position, Ψ = 0 means uniform distribution.
 """
 function calculate_order_parameter(phi_values::Vector{Float64})
-    N = length(phi_values)
-    if N == 0
-        return 0.0
-    end
-
-    z = sum(exp(im * φ) for φ in phi_values) / N
-    return abs(z)
+    # hypot(Σcos φ, Σsin φ)/N: same value without complex arithmetic
+    return order_parameter(phi_values)
 end
 
 """
@@ -221,14 +217,9 @@ function analyze_simulation_from_hdf5(h5_file::String)
     # Time evolution analysis (for stability check)
     if n_snapshots >= 5
         start_idx = max(1, Int(round(0.8 * n_snapshots)))
-        σ_φ_values = Float64[]
-        Ψ_values = Float64[]
-
-        for i in start_idx:n_snapshots
-            phi = Vector{Float64}(result.phi[i, :])
-            push!(σ_φ_values, std(phi))
-            push!(Ψ_values, calculate_order_parameter(phi))
-        end
+        late = view(result.phi, start_idx:n_snapshots, :)
+        σ_φ_values = [std(view(late, i, :)) for i in axes(late, 1)]
+        Ψ_values = order_parameter_series(late)
 
         metrics["sigma_phi_mean_late"] = mean(σ_φ_values)
         metrics["sigma_phi_std_late"] = std(σ_φ_values)
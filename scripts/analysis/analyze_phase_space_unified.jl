@@ -8,6 +8,7 @@ Pkg.activate(".")
 using HDF5
 using Statistics
 using Printf
+ENV["GKSwstype"] = "100"
 using Plots
 gr()
 
@@ -26,9 +26,12 @@ using JSON
 using Statistics
 using DataFrames
 using CSV
+ENV["GKSwstype"] = "100"
 using Plots
 using Printf
 
+include(joinpath(dirname(dirname(@__DIR__)), "src", "order_parameters.jl"))
+
 """
     compute_angular_correlation(phi::Vector{Float64}, n_bins::Int=50)
 
@@ -46,16 +49,8 @@ Returns:
 function compute_angular_correlation(phi::Vector{Float64}, n_bins::Int=50)
     N = length(phi)
 
-    # Calculate all pairwise angular distances
-    distances = Float64[]
-    for i in 1:N
-        for j in (i+1):N
-            # Angular distance (periodic)
-            d = abs(phi[i] - phi[j])
-            d_min = min(d, 2π - d)
-            push!(distances, d_min)
-        end
-    end
+    # Calculate all pairwise angular distances (periodic)
+    distances = pairwise_angular_distances(phi)
 
     # Create histogram
     r_max = π  # Maximum distance on circle is π
@@ -8,6 +8,8 @@ using CairoMakie
 using Printf
 using StatsBase
 
+include(joinpath(dirname(dirname(@__DIR__)), "src", "order_parameters.jl"))
+
 println("="^80)
 println("SPATIAL CORRELATION ANALYSIS: g(Δφ)")
 println("="^80)
@@ -46,17 +48,7 @@ function pair_correlation(phi_positions, n_bins=120)
     delta_phi_centers = (delta_phi_edges[1:end-1] .+ delta_phi_edges[2:end]) ./ 2
 
     # Compute all pairwise distances (periodic on circle)
-    distances = Float64[]
-
-    for i in 1:N
-        for j in i+1:N
-            # Angular distance (shortest on circle)
-            d = abs(phi_positions[i] - phi_positions[j])
-            d = min(d, 2π - d)  # Periodic boundary
-
-            push!(distances, d)
-        end
-    end
+    distances = pairwise_angular_distances(phi_positions)
 
     # Histogram of distances
     hist = fit(Histogram, distances, delta_phi_edges)
@@ -46,6 +46,10 @@ h5open(h5_file, "r") do file
     time = read(traj["time"])
     phi = read(traj["phi"])  # [N, n_timesteps]
 
+    # Envolver a [0, 2π) una sola vez, en el mismo arreglo; todos los
+    # snapshots de abajo son vistas de columnas ya envueltas
+    phi .= mod.(phi, 2π)
+
     n_times = length(time)
 
     println("Datos:")
@@ -86,7 +90,7 @@ h5open(h5_file, "r") do file
 
     # Para cada snapshot
     for (idx, label) in zip(indices, labels)
-        phi_snap = mod.(phi[:, idx], 2π)
+        phi_snap = view(phi, :, idx)
         t_snap = time[idx]
 
         # Calcular densidad en regiones clave
@@ -126,7 +130,7 @@ h5open(h5_file, "r") do file
     println()
 
     # Distribución inicial (t=0)
-    phi_inicial = mod.(phi[:, 1], 2π)
+    phi_inicial = view(phi, :, 1)
     bins_inicial = range(0, 2π, length=9)
     counts_inicial = zeros(Int, 8)
 
@@ -150,7 +154,7 @@ h5open(h5_file, "r") do file
     println()
 
     # Distribución final (t=100s)
-    phi_final = mod.(phi[:, end], 2π)
+    phi_final = view(phi, :, n_times)
     counts_final = zeros(Int, 8)
 
     for p in phi_final
@@ -186,12 +190,12 @@ h5open(h5_file, "r") do file
     ϵ = 0.35
 
     # Estado inicial
-    phi_i = mod.(phi[:, 1], 2π)
+    phi_i = phi_inicial
     major_i = sum((abs.(phi_i) .< ϵ) .| (abs.(phi_i .- π) .< ϵ) .| (abs.(phi_i .- 2π) .< ϵ))
     minor_i = sum((abs.(phi_i .- π/2) .< ϵ) .| (abs.(phi_i .- 3π/2) .< ϵ))
 
     # Estado final
-    phi_f = mod.(phi[:, end], 2π)
+    phi_f = phi_final
     major_f = sum((abs.(phi_f) .< ϵ) .| (abs.(phi_f .- π) .< ϵ) .| (abs.(phi_f .- 2π) .< ϵ))
     minor_f = sum((abs.(phi_f .- π/2) .< ϵ) .| (abs.(phi_f .- 3π/2) .< ϵ))
 
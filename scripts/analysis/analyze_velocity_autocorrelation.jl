@@ -11,9 +11,6 @@ Usage:
     julia --project=. scripts/analysis/analyze_velocity_autocorrelation.jl <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Statistics
 using Printf
 using DataFrames
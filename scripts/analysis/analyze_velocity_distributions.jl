@@ -15,6 +15,7 @@ Usage:
 using HDF5
 using Statistics, StatsBase
 using Distributions
+ENV["GKSwstype"] = "100"
 using Plots
 using DataFrames, CSV
 using Printf
@@ -21,9 +21,6 @@ Salida:
     - Validación de conservación de energía
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Printf
 using Dates
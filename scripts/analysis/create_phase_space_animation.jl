@@ -7,9 +7,6 @@ Usage:
     julia --project=. scripts/analysis/create_phase_space_animation.jl <h5_file> [output_dir]
 """
 
-using Pkg
-Pkg.activate(".")
-
 using HDF5
 using Statistics
 using Printf
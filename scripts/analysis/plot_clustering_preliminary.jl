@@ -8,6 +8,7 @@
 
 using CSV
 using DataFrames
+ENV["GKSwstype"] = "100"
 using Plots
 using Statistics
 using Printf
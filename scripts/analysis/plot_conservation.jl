@@ -11,6 +11,7 @@ Genera dos gráficas:
     - momento_conjugado_vs_tiempo.png
 """
 
+ENV["GKSwstype"] = "100"
 using Plots
 using DelimitedFiles
 using Printf
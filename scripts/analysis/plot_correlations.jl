@@ -4,6 +4,7 @@
 using HDF5
 using Statistics
 using Printf
+ENV["GKSwstype"] = "100"
 using Plots
 
 # Funciones geométricas
@@ -21,6 +21,7 @@ using Printf
 # Try to load Plots.jl, fall back to ASCII if not available
 PLOTS_AVAILABLE = false
 try
+    ENV["GKSwstype"] = "100"
     using Plots
     global PLOTS_AVAILABLE = true
     println("✓ Plots.jl available - will create graphical plots")
@@ -322,10 +323,9 @@ if PLOTS_AVAILABLE
                  title="Angular Position Trajectories",
                  legend=false, size=(800, 600))
 
-    for j in 1:n_particles
-        plot!(p_phi, data.times, φ_traj[:, j],
-              linewidth=1.5, alpha=0.7)
-    end
+    # One call: each column of φ_traj becomes a series
+    plot!(p_phi, data.times, φ_traj,
+          linewidth=1.5, alpha=0.7)
 
     savefig(p_phi, joinpath(traj_dir, "phi_vs_time.png"))
     println("  ✓ Saved: $traj_dir/phi_vs_time.png")
@@ -335,10 +335,8 @@ if PLOTS_AVAILABLE
                     title="Angular Velocity Trajectories",
                     legend=false, size=(800, 600))
 
-    for j in 1:n_particles
-        plot!(p_phidot, data.times, φ_dot_traj[:, j],
-              linewidth=1.5, alpha=0.7)
-    end
+    plot!(p_phidot, data.times, φ_dot_traj,
+          linewidth=1.5, alpha=0.7)
 
     savefig(p_phidot, joinpath(traj_dir, "phidot_vs_time.png"))
     println("  ✓ Saved: $traj_dir/phidot_vs_time.png")
@@ -349,15 +347,13 @@ if PLOTS_AVAILABLE
                    legend=false, size=(800, 800),
                    xlims=(0, 2π))
 
-    for j in 1:n_particles
-        plot!(p_phase, φ_traj[:, j], φ_dot_traj[:, j],
-              linewidth=1, alpha=0.5)
-        # Mark initial and final positions
-        scatter!(p_phase, [φ_traj[1, j]], [φ_dot_traj[1, j]],
-                markersize=8, color=:green, markershape=:circle)
-        scatter!(p_phase, [φ_traj[end, j]], [φ_dot_traj[end, j]],
-                markersize=8, color=:red, markershape=:star)
-    end
+    plot!(p_phase, φ_traj, φ_dot_traj,
+          linewidth=1, alpha=0.5)
+    # Mark initial and final positions (one series each)
+    scatter!(p_phase, φ_traj[1, :], φ_dot_traj[1, :],
+            markersize=8, color=:green, markershape=:circle)
+    scatter!(p_phase, φ_traj[end, :], φ_dot_traj[end, :],
+            markersize=8, color=:red, markershape=:star)
 
     savefig(p_phase, joinpath(traj_dir, "phase_space.png"))
     println("  ✓ Saved: $traj_dir/phase_space.png")
@@ -382,10 +378,8 @@ if PLOTS_AVAILABLE
                     title="Continuous Angular Motion",
                     legend=false, size=(800, 600))
 
-    for j in 1:n_particles
-        plot!(p_unwrap, data.times, φ_unwrapped[:, j],
-              linewidth=1.5, alpha=0.7)
-    end
+    plot!(p_unwrap, data.times, φ_unwrapped,
+          linewidth=1.5, alpha=0.7)
 
     savefig(p_unwrap, joinpath(traj_dir, "phi_unwrapped.png"))
     println("  ✓ Saved: $traj_dir/phi_unwrapped.png")
@@ -10,6 +10,7 @@ using Statistics
 using Printf
 using DataFrames
 using CSV
+ENV["GKSwstype"] = "100"
 using Plots
 gr()  # Use GR backend (default)
 
@@ -4,6 +4,7 @@
 #
 
 using HDF5, Statistics, Printf
+ENV["GKSwstype"] = "100"
 using Plots
 gr()
 
@@ -144,22 +145,25 @@ h5open(h5_file, "r") do f
 
     fig3 = plot(layout=(1, 3), size=(1200, 400), dpi=150)
 
-    for (subplot_idx, t_idx) in enumerate([1, n_time÷2, n_time])
-        phi_t = phi[t_idx, :]
+    # Posiciones cartesianas de los tres snapshots en una sola pasada
+    # (en Float32: estos arreglos sólo se grafican)
+    t_indices = [1, n_time÷2, n_time]
+    x_snapshots, y_snapshots = cartesian_from_polar_angles(phi[t_indices, :], a, b;
+                                                           precision=Float32)
+
+    # Contorno de la elipse: igual en los tres paneles, se muestrea una vez
+    θ_ellipse = range(0, 2π, length=200)
+    x_ellipse, y_ellipse = cartesian_from_polar_angles(θ_ellipse, a, b; precision=Float32)
+
+    for (subplot_idx, t_idx) in enumerate(t_indices)
         phidot_t = abs.(phidot[t_idx, :])
         t_val = (t_idx - 1) / (n_time - 1) * 100
 
-        θ_ellipse = range(0, 2π, length=200)
-        r_ellipse = [radial_ellipse(θ, a, b) for θ in θ_ellipse]
-        x_ellipse = r_ellipse .* cos.(θ_ellipse)
-        y_ellipse = r_ellipse .* sin.(θ_ellipse)
-
         plot!(fig3[subplot_idx], x_ellipse, y_ellipse,
               color=:lightgray, linewidth=2, label="", aspect_ratio=:equal)
 
-        r_particles = [radial_ellipse(φ, a, b) for φ in phi_t]
-        x_particles = r_particles .* cos.(phi_t)
-        y_particles = r_particles .* sin.(phi_t)
+        x_particles = x_snapshots[subplot_idx, :]
+        y_particles = y_snapshots[subplot_idx, :]
 
         scatter!(fig3[subplot_idx], x_particles, y_particles,
                 markersize=4, markerstrokewidth=0,
@@ -201,8 +205,10 @@ for run_dir in run_dirs[1:min(15, length(run_dirs))]
 end
 
 a, b = 2.0, 2.0 * sqrt(1 - 0.9^2)
-κ_all = [curvature_ellipse_polar(φ, a, b) for φ in phi_all]
-g_all = [metric_ellipse_polar(φ, a, b) for φ in phi_all]
+# κ y g de una sola evaluación por partícula (comparten S, r y u)
+κ_g = curvature_and_metric_polar.(phi_all, a, b)
+κ_all = first.(κ_g)
+g_all = last.(κ_g)
 
 fig4 = plot(layout=(1, 2), size=(1000, 400), dpi=150)
 
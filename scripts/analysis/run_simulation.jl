@@ -22,9 +22,6 @@ Este script:
 5. Genera resumen y estadísticas
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Printf
 using Dates
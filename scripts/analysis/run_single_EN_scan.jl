@@ -18,9 +18,6 @@ Arguments:
     campaign_dir - Output directory
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Random
 using Printf
 using Dates
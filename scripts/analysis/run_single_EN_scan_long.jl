@@ -8,9 +8,6 @@ Usage:
     julia --project=. run_single_EN_scan_long.jl <run_id> <N> <e> <E_per_N> <t_max> <seed> <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Random
 using Printf
 using Dates
@@ -1,9 +1,6 @@
 #!/usr/bin/env julia
 # Run single experiment from eccentricity scan
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Random
 using HDF5
@@ -10,9 +10,6 @@ Lee parámetros desde parameter_matrix_final_campaign.csv y ejecuta la simulaci
 correspondiente con geometría intrínseca y energy projection activado.
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CSV
 using DataFrames
 using Random
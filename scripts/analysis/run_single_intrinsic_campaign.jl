@@ -10,9 +10,6 @@ Recibe TODOS los parámetros desde la línea de comandos (no lee de CSV).
 Usa detección de colisiones intrínseca y energy projection.
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Random
 using Printf
 using Dates
@@ -16,9 +16,6 @@ Uso:
     julia --project=. run_single_intrinsic_campaign_v2.jl <run_id> <N> <e> <a> <seed> <max_time> <dt_max> <dt_min> <save_interval> <N_max_ref> <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Random
 using Printf
 using Dates
@@ -11,9 +11,6 @@ Uso:
     julia --project=. run_single_intrinsic_relaunch.jl <run_id> <N> <e> <a> <b> <seed> <max_time> <dt_max> <dt_min> <save_interval> <campaign_dir>
 """
 
-using Pkg
-Pkg.activate(".")
-
 using Random
 using Printf
 using Dates
@@ -11,9 +11,6 @@ Configuración:
 - Análisis completo de conservación, distribución espacial, velocidades
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Printf
 using Statistics
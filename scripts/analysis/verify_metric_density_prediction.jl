@@ -19,9 +19,6 @@ Usage:
     julia --project=. scripts/analysis/verify_metric_density_prediction.jl <campaign_dir> [output_dir]
 """
 
-using Pkg
-Pkg.activate(".")
-
 using HDF5
 using Statistics
 using LinearAlgebra
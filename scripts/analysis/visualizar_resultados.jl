@@ -10,10 +10,8 @@ Uso:
     julia --project=. visualizar_resultados.jl results/analisis_completo_YYYYMMDD_HHMMSS/
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
+ENV["GKSwstype"] = "100"
 using Plots
 using CSV
 using DataFrames
@@ -146,10 +146,9 @@ for (snap_idx, snapshot) in enumerate(data.particles_history)
         bin_idx = min(bin_idx, n_bins)
 
         if bin_idx >= 1 && bin_idx <= n_bins
-            # Get metric at this location
-            g_φφ = metric_ellipse_polar(p.φ, a, b)
-            # Physical velocity (not φ̇, but actual speed)
-            v_phys = abs(p.φ_dot) * sqrt(g_φφ)
+            # Physical velocity (not φ̇, but actual speed): the particle already
+            # stores its Cartesian velocity, |v| = √g_φφ·|φ̇|
+            v_phys = norm(p.vel)
 
             push!(bin_velocities[bin_idx], v_phys)
             bin_counts[bin_idx] += 1
@@ -18,9 +18,6 @@ Parámetros de simulación:
 - Tamaño de partícula: FIJO (100 partículas cubrirían la curva completamente)
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CSV
 using DataFrames
 using Printf
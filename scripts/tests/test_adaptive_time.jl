@@ -17,9 +17,6 @@ Este test demuestra las mejoras implementadas:
 - Manejo de partículas "pegadas"
 """
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Printf
 using Statistics
@@ -1,9 +1,6 @@
 #!/usr/bin/env julia
 # Test: Condiciones iniciales UNIFORMES para confirmar formación dinámica de clustering
 
-using Pkg
-Pkg.activate(".")
-
 using CollectiveDynamics
 using Random
 using HDF5
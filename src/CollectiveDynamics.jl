@@ -81,6 +81,7 @@ include("particles_polar.jl")
 const Particle = ParticlePolar
 const update_particle = update_particle_polar
 const forest_ruth_step_ellipse = forest_ruth_step_polar
+const integrate_forest_ruth = integrate_forest_ruth_polar
 const metric_ellipse = metric_ellipse_polar
 const christoffel_ellipse = christoffel_ellipse_polar
 const generate_random_particles = generate_random_particles_polar
@@ -173,9 +174,14 @@ export radial_ellipse,
        inverse_metric_ellipse_polar,
        metric_derivative_polar,
        cartesian_from_polar_angle,
+       cartesian_from_polar_angles,
+       physical_speeds_polar,
        velocity_from_polar_angular,
+       cartesian_state_from_polar,
        kinetic_energy_polar,
        curvature_ellipse_polar,
+       curvature_and_metric_polar,
+       curvatures_polar,
        polar_angle_from_eccentric,
        eccentric_angle_from_polar
 
@@ -208,6 +214,8 @@ export ForestRuthCoefficients,
        forest_ruth_step_ellipse!,
        forest_ruth_simplified,
        integrate_forest_ruth,
+       integrate_forest_ruth_polar,
+       integrate_forest_ruth_ensemble,
        verify_symplecticity
 
 # ============================================================================
@@ -244,7 +252,9 @@ export check_collision,
 
 export time_to_collision,
        find_next_collision,
-       find_next_collision_parallel
+       find_next_collision!,
+       find_next_collision_parallel,
+       find_next_collision_parallel!
 
 # ============================================================================
 # Exports - Conservación
@@ -476,6 +486,9 @@ Este es el algoritmo descrito en el artículo:
 - `tolerance`: Tolerancia para verificar conservación
 - `max_steps`: Número máximo de pasos de integración (seguridad contra loops infinitos)
 - `use_parallel`: Usar detección paralela de colisiones (requiere `julia -t N`, N≥30 recomendado)
+- `diagnostics`: Función opcional `diagnostics(particles, t)` llamada en cada guardado
+  (incluido t = 0) con el estado actual. Permite reducir observables en línea
+  (p.ej. Ψ(t)) sin recorrer `particles_history` de nuevo después de la simulación
 - `verbose`: Imprimir progreso
 
 # Retorna
@@ -487,6 +500,11 @@ particles = generate_random_particles(40, 1.0, 0.05, 2.0, 1.0)
 data = simulate_ellipse_adaptive(particles, 2.0, 1.0;
                                  max_time=1.0, dt_max=1e-5,
                                  max_steps=50_000_000, verbose=true)
+
+# Parámetro de orden Ψ(t) calculado durante la simulación
+psi = Float64[]
+record_psi(ps, t) = push!(psi, hypot(sum(p -> cos(p.φ), ps), sum(p -> sin(p.φ), ps)) / length(ps))
+data = simulate_ellipse_adaptive(particles, 2.0, 1.0; max_time=1.0, diagnostics=record_psi)
 ```
 
 # Ventajas
@@ -517,6 +535,7 @@ function simulate_ellipse_adaptive(
     use_projection::Bool = false,
     projection_interval::Int = 100,
     projection_tolerance::T = T(1e-12),
+    diagnostics = nothing,
     verbose::Bool = true
 ) where {T <: AbstractFloat}
 
@@ -526,7 +545,10 @@ function simulate_ellipse_adaptive(
     # Inicializar estructuras de datos con PREALLOCACIÓN
     # Estimar número de saves basado en save_interval
     expected_saves = ceil(Int, max_time / save_interval) + 100  # +100 buffer
-    expected_steps = ceil(Int, max_time / dt_max) * 2 + 10000  # Estimación conservadora (2x por colisiones)
+    # Cota inferior (dt ≤ dt_max): los pasos extra por colisiones se añaden con
+    # resize!, cuyo crecimiento es amortizado. Reservar 2x dejaba la mitad de
+    # tres arreglos por paso sin usar durante toda la vida de SimulationData
+    expected_steps = ceil(Int, max_time / dt_max) + 10000
 
     particles_history = Vector{Vector{Particle{T}}}(undef, expected_saves)
     times_saved = Vector{T}(undef, expected_saves)
@@ -536,12 +558,20 @@ function simulate_ellipse_adaptive(
 
     conservation_data = ConservationData{T}()
 
+    # Buffers SoA de la búsqueda de colisiones (secuencial o paralela),
+    # reutilizados en cada paso
+    n_particles = length(particles)
+    φ_buf = Vector{T}(undef, n_particles)
+    φ_dot_buf = Vector{T}(undef, n_particles)
+    radius_buf = Vector{T}(undef, n_particles)
+
     # Guardar estado inicial (usar índice en lugar de push!)
     save_idx = 1
     step_idx = 0
     particles_history[save_idx] = copy(particles)
     times_saved[save_idx] = zero(T)
     record_conservation!(conservation_data, particles, zero(T), a, b)
+    diagnostics === nothing || diagnostics(particles, zero(T))
     save_idx += 1
 
     # Guardar energía y momento iniciales para projection
@@ -590,13 +620,15 @@ function simulate_ellipse_adaptive(
         # Paso 1: Encontrar próxima colisión
         # Usar versión paralela si está habilitada y hay threads disponibles
         collision_info = if use_parallel && Threads.nthreads() > 1
-            find_next_collision_parallel(
+            find_next_collision_parallel!(
+                φ_buf, φ_dot_buf, radius_buf,
                 particles, a, b;
                 max_time = dt_max,
                 min_dt = dt_min
             )
         else
-            find_next_collision(
+            find_next_collision!(
+                φ_buf, φ_dot_buf, radius_buf,
                 particles, a, b;
                 max_time = dt_max,
                 min_dt = dt_min
@@ -673,6 +705,7 @@ function simulate_ellipse_adaptive(
             particles_history[save_idx] = copy(particles)
             times_saved[save_idx] = t
             record_conservation!(conservation_data, particles, t, a, b)
+            diagnostics === nothing || diagnostics(particles, t)
             t_next_save += save_interval
 
             if verbose && (save_idx % 10 == 0)
@@ -700,6 +733,11 @@ function simulate_ellipse_adaptive(
     resize!(n_collisions_vec, step_idx)
     resize!(conserved_fractions_vec, step_idx)
 
+    # resize! no libera capacidad: devolver el exceso reservado
+    sizehint!(dt_history, step_idx)
+    sizehint!(n_collisions_vec, step_idx)
+    sizehint!(conserved_fractions_vec, step_idx)
+
     if verbose
         println("=" ^ 70)
         println("SIMULACIÓN COMPLETADA")
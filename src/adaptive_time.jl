@@ -63,9 +63,30 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
     b::T;
     max_time::T = T(Inf)
 ) where {T <: AbstractFloat}
+    return time_to_collision(p1.φ, p1.φ_dot, p2.φ, p2.φ_dot, p1.radius + p2.radius, a, b;
+                             max_time = max_time)
+end
+
+"""
+    time_to_collision(φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b; max_time=Inf)
+
+Núcleo escalar de `time_to_collision`: recibe sólo el estado que usa la
+predicción (posiciones, velocidades angulares y suma de radios), de modo que
+los bucles sobre pares pueden alimentarlo desde arreglos contiguos (SoA) sin
+cargar los structs `Particle` completos.
+"""
+@inline function time_to_collision(
+    φ1::T,
+    φ_dot1::T,
+    φ2::T,
+    φ_dot2::T,
+    r_sum::T,
+    a::T,
+    b::T;
+    max_time::T = T(Inf)
+) where {T <: AbstractFloat}
 
     # Calcular separación actual
-    φ1, φ2 = p1.φ, p2.φ
     Δθ = abs(φ2 - φ1)
     # Optimización: pre-calcular constante
     TWO_PI = T(2π)
@@ -81,8 +102,6 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
     # ========================================================================
     # Si las partículas están muy separadas angularmente, NO PUEDEN colisionar
     # Calculamos θ_max: máxima separación angular para posible colisión
-    r_sum = p1.radius + p2.radius
-
     # Aproximación conservadora: usar el eje menor (b) para distancia mínima
     # θ_max ≈ (r₁ + r₂) / min(a, b)
     # Multiplicamos por factor de seguridad 1.5 para ser conservadores
@@ -101,13 +120,10 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
     g_mid = sqrt(metric_ellipse(θ_mid, a, b))
     current_distance = g_mid * Δθ
 
-    # Obtener velocidades (necesarias para el closure más adelante)
-    θ_dot1, θ_dot2 = p1.φ_dot, p2.φ_dot
-
     # Si ya están en contacto o muy cerca, verificar si se están separando
     if current_distance <= 1.2 * r_sum  # 20% de margen
         # Velocidad relativa
-        θ_dot_rel = θ_dot2 - θ_dot1
+        φ_dot_rel = φ_dot2 - φ_dot1
 
         # Diferencia angular SIGNED con wraparound correcto
         # Normalizar a [-π, π] para obtener el camino más corto
@@ -116,8 +132,8 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
         Δθ_signed = mod(Δθ_raw + PI, TWO_PI) - PI
 
         # Si Δθ_signed > 0: φ2 está adelante (sentido positivo)
-        # Si θ_dot_rel > 0: φ2 se mueve más rápido → se alejan
-        if Δθ_signed * θ_dot_rel > zero(T)
+        # Si φ_dot_rel > 0: φ2 se mueve más rápido → se alejan
+        if Δθ_signed * φ_dot_rel > zero(T)
             # Se están alejando
             return T(Inf)
         else
@@ -132,28 +148,10 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
 
     # Estimación inicial: tiempo cuando θ_rel → 0 (si se mueven en círculo)
     # Más precisamente, necesitamos resolver numéricamente
-
-    # Función objetivo: distancia geodésica - suma de radios
-    function separation_at_time(t::T)
-        # Posiciones aproximadas (velocidades constantes)
-        # Normalizar ángulos a [0, 2π] para evitar overflow numérico
-        φ1_t = mod(φ1 + θ_dot1 * t, T(2π))
-        φ2_t = mod(φ2 + θ_dot2 * t, T(2π))
-
-        # Diferencia angular (tomando camino más corto)
-        Δθ = abs(φ2_t - φ1_t)
-        Δθ = min(Δθ, T(2π) - Δθ)
-
-        # Distancia geodésica aproximada
-        θ_mid = (φ1_t + φ2_t) / 2
-        g_mid = sqrt(metric_ellipse(θ_mid, a, b))
-        d_geo = g_mid * Δθ
-
-        return d_geo - r_sum
-    end
+    # Función objetivo: distancia geodésica - suma de radios (_separation_at_time)
 
     # Distancia inicial
-    sep_0 = separation_at_time(zero(T))
+    sep_0 = _separation_at_time(zero(T), φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b)
 
     # Si sep_0 <= 0, ya están colisionando
     if sep_0 <= zero(T)
@@ -162,7 +160,7 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
 
     # Distancia a max_time
     if isfinite(max_time)
-        sep_max = separation_at_time(max_time)
+        sep_max = _separation_at_time(max_time, φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b)
         # Si sep_max > 0, no colisionan en el intervalo
         if sep_max > zero(T)
             return T(Inf)
@@ -174,12 +172,12 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
     t_max = isfinite(max_time) ? max_time : T(10.0)  # Límite razonable si max_time es Inf
 
     # Si sep(t_max) > 0, buscar hacia adelante
-    while separation_at_time(t_max) > zero(T) && t_max < T(100.0)
+    while _separation_at_time(t_max, φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b) > zero(T) && t_max < T(100.0)
         t_max *= 2
     end
 
     # Si aún no cruza, no hay colisión
-    if separation_at_time(t_max) > zero(T)
+    if _separation_at_time(t_max, φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b) > zero(T)
         return T(Inf)
     end
 
@@ -189,7 +187,7 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
 
     for _ in 1:max_iterations
         t_mid = (t_min + t_max) / 2
-        sep_mid = separation_at_time(t_mid)
+        sep_mid = _separation_at_time(t_mid, φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b)
 
         if abs(sep_mid) < tolerance || (t_max - t_min) < tolerance
             # Verificar que el tiempo encontrado sea razonable
@@ -218,6 +216,39 @@ Esto es válido porque dt es pequeño y la aceleración geodésica
     return t_collision
 end
 
+"""
+    _separation_at_time(t, φ1, φ_dot1, φ2, φ_dot2, r_sum, a, b)
+
+Función objetivo de `time_to_collision`: distancia geodésica aproximada menos
+la suma de radios tras avanzar un tiempo `t` con velocidades angulares
+constantes.
+
+Es una función de módulo que recibe sólo escalares. Como closure dentro de
+`time_to_collision` reasignaba `Δθ`, `θ_mid` y `g_mid` del ámbito externo,
+lo que las convertía en `Core.Box` (inestabilidad de tipos y una asignación
+en cada evaluación de la bisección).
+"""
+@inline function _separation_at_time(
+    t::T, φ1::T, φ_dot1::T, φ2::T, φ_dot2::T, r_sum::T, a::T, b::T
+) where {T <: AbstractFloat}
+    TWO_PI = T(2π)
+
+    # Posiciones aproximadas (velocidades constantes)
+    # Normalizar ángulos a [0, 2π] para evitar overflow numérico
+    φ1_t = mod(φ1 + φ_dot1 * t, TWO_PI)
+    φ2_t = mod(φ2 + φ_dot2 * t, TWO_PI)
+
+    # Diferencia angular (tomando camino más corto)
+    Δθ = abs(φ2_t - φ1_t)
+    Δθ = min(Δθ, TWO_PI - Δθ)
+
+    # Distancia geodésica aproximada
+    θ_mid = (φ1_t + φ2_t) / 2
+    g_mid = sqrt(metric_ellipse(θ_mid, a, b))
+
+    return g_mid * Δθ - r_sum
+end
+
 """
     find_next_collision(particles::Vector{Particle}, a, b; max_time=Inf, min_dt=1e-10)
 
@@ -246,16 +277,47 @@ function find_next_collision(
     max_time::T = T(Inf),
     min_dt::T = T(1e-10)
 ) where {T <: AbstractFloat}
+    n = length(particles)
+    return find_next_collision!(Vector{T}(undef, n), Vector{T}(undef, n), Vector{T}(undef, n),
+                                particles, a, b; max_time=max_time, min_dt=min_dt)
+end
+
+"""
+    find_next_collision!(φs, φ_dots, radii, particles, a, b; max_time=Inf, min_dt=1e-10)
+
+Versión de [`find_next_collision`](@ref) que usa `φs`, `φ_dots` y `radii`
+(longitud N) como buffers para el estado en formato SoA. El integrador
+adaptativo los reserva una vez y los reutiliza en cada paso, en lugar de
+asignar tres vectores nuevos por paso.
+"""
+function find_next_collision!(
+    φs::AbstractVector{T},
+    φ_dots::AbstractVector{T},
+    radii::AbstractVector{T},
+    particles::Vector{Particle{T}},
+    a::T,
+    b::T;
+    max_time::T = T(Inf),
+    min_dt::T = T(1e-10)
+) where {T <: AbstractFloat}
 
     n = length(particles)
+
     t_min = max_time
     pair_min = (0, 0)
     found = false
 
+    # Estado en formato SoA: el bucle O(N²) sólo necesita φ, φ̇ y radio, así
+    # que se copian una vez a arreglos contiguos en lugar de leer cada
+    # Particle completo (id, masa, pos, vel, ...) en cada par
+    _collision_state_soa!(φs, φ_dots, radii, particles)
+
     # Buscar tiempo mínimo sobre todos los pares
     @inbounds for i in 1:n
+        φ_i, φ_dot_i, r_i = φs[i], φ_dots[i], radii[i]
         for j in (i+1):n
-            t_coll = time_to_collision(particles[i], particles[j], a, b; max_time=max_time)
+            t_coll = time_to_collision(φ_i, φ_dot_i, φs[j], φ_dots[j], r_i + radii[j], a, b;
+                                       max_time=max_time)
 
             if isfinite(t_coll) && t_coll < t_min
                 t_min = t_coll
@@ -273,6 +335,23 @@ function find_next_collision(
     return (dt = t_min, pair = pair_min, found = found)
 end
 
+# Copia φ, φ̇ y radio de cada partícula a los buffers SoA de la búsqueda de
+# colisiones (compartido por las versiones secuencial y paralelas)
+function _collision_state_soa!(φs, φ_dots, radii, particles)
+    n = length(particles)
+    length(φs) == length(φ_dots) == length(radii) == n ||
+        throw(DimensionMismatch("buffers must have length N = $n"))
+
+    @inbounds for k in 1:n
+        p = particles[k]
+        φs[k] = p.φ
+        φ_dots[k] = p.φ_dot
+        radii[k] = p.radius
+    end
+
+    return nothing
+end
+
 # ============================================================================
 # Imports de funciones necesarias
 # ============================================================================
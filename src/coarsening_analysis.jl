@@ -53,19 +53,22 @@ function compute_cluster_evolution(particles_history, times, a, b, threshold)
     T = eltype(times)
     n_snapshots = length(times)
 
-    N_clusters = Int[]
-    s_max = Int[]
-    s_avg = T[]
+    # One entry per snapshot: allocate once and fill by index
+    N_clusters = zeros(Int, n_snapshots)
+    s_max = zeros(Int, n_snapshots)
+    s_avg = zeros(T, n_snapshots)
 
     for i in 1:n_snapshots
         particles = particles_history[i]
         clusters = identify_clusters(particles, a, b, threshold)
 
+        isempty(clusters) && continue
+
         cluster_sizes = [length(c) for c in clusters]
 
-        push!(N_clusters, length(clusters))
-        push!(s_max, isempty(cluster_sizes) ? 0 : maximum(cluster_sizes))
-        push!(s_avg, isempty(cluster_sizes) ? 0.0 : mean(cluster_sizes))
+        N_clusters[i] = length(clusters)
+        s_max[i] = maximum(cluster_sizes)
+        s_avg[i] = mean(cluster_sizes)
     end
 
     return times, N_clusters, s_max, s_avg
@@ -84,13 +87,37 @@ Particles are in same cluster if their Cartesian distance < threshold.
 function identify_clusters(particles, a, b, threshold)
     N = length(particles)
 
-    # Build adjacency matrix
-    adjacent = falses(N, N)
-    for i in 1:N, j in (i+1):N
-        dist = cartesian_distance(particles[i], particles[j])
-        if dist < threshold
-            adjacent[i, j] = true
-            adjacent[j, i] = true
+    # Build adjacency lists (ascending indices, same DFS order as a dense scan)
+    neighbors = [Int[] for _ in 1:N]
+
+    # Both points lie at r ≥ r_min, so the chord is ≥ r_min·sin(Δφ) for Δφ ≤ π/2
+    # and ≥ r_min beyond: only pairs within Δφ_max = asin(threshold/r_min) can link.
+    r_min = min(a, b)
+    if threshold < r_min
+        Δφ_max = asin(threshold / r_min)
+        φs = [mod(p.φ, 2π) for p in particles]
+        order = sortperm(φs)
+
+        for k in 1:N
+            i = order[k]
+            # Walk forward (cyclically) through the sorted window
+            for m in 1:(N-1)
+                j = order[mod1(k + m, N)]
+                gap = φs[j] - φs[i] + (k + m > N ? 2π : 0.0)
+                gap > Δφ_max && break
+                if cartesian_distance(particles[i], particles[j]) < threshold
+                    push!(neighbors[i], j)
+                    push!(neighbors[j], i)
+                end
+            end
+        end
+        foreach(sort!, neighbors)
+    else
+        for i in 1:N, j in (i+1):N
+            if cartesian_distance(particles[i], particles[j]) < threshold
+                push!(neighbors[i], j)
+                push!(neighbors[j], i)
+            end
         end
     end
 
@@ -110,8 +137,8 @@ function identify_clusters(particles, a, b, threshold)
                     push!(cluster, node)
 
                     # Add neighbors to stack
-                    for j in 1:N
-                        if adjacent[node, j] && !visited[j]
+                    for j in neighbors[node]
+                        if !visited[j]
                             push!(stack, j)
                         end
                     end
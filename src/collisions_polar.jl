@@ -177,50 +177,27 @@ function resolve_collision_polar(
     # Convertir velocidades cartesianas → φ̇
     # Necesitamos: v = (dx/dφ) φ̇
     # Por lo tanto: φ̇ = |v| / |dx/dφ|
+    #
+    # dx/dφ es la velocidad con φ̇ = 1, y
+    # |dx/dφ|² = (dr/dφ)² + r² = g_φφ, así que basta con productos punto:
+    # φ̇ = ±√(v·v / g_φφ), con el signo de v · dx/dφ.
 
     # Para p1
     φ1 = p1.φ
-    r1 = radial_ellipse(φ1, a, b)
-    dr1_dφ = radial_derivative_ellipse(φ1, a, b)
-
-    # |dx/dφ| = √[(dr/dφ·cos(φ) - r·sin(φ))² + (dr/dφ·sin(φ) + r·cos(φ))²]
-    #         = √[(dr/dφ)² + r²]
-    #         = √g_φφ
-    g1 = metric_ellipse_polar(φ1, a, b)
-    dxdφ_mag1 = sqrt(g1)
-
-    # Magnitud de la nueva velocidad
-    v1_new_mag = norm(v1_new)
-
-    # φ̇₁ magnitud (sin signo aún)
-    φ_dot1_mag = v1_new_mag / dxdφ_mag1
-
-    # Determinar signo de φ̇₁ basado en dirección de v1_new
-    # Calcular dirección tangente en φ₁
-    s1, c1 = sincos(φ1)
-    tangent1 = SVector(dr1_dφ * c1 - r1 * s1, dr1_dφ * s1 + r1 * c1)
-    tangent1_normalized = tangent1 / norm(tangent1)
+    _, tangent1 = cartesian_state_from_polar(φ1, one(T), a, b)
+    g1 = dot(tangent1, tangent1)
 
     # Si v1_new está en dirección del tangente, φ̇ > 0; si no, φ̇ < 0
-    sign1 = sign(dot(v1_new, tangent1_normalized))
-    φ_dot1_new = sign1 * φ_dot1_mag
+    sign1 = sign(dot(v1_new, tangent1))
+    φ_dot1_new = sign1 * sqrt(dot(v1_new, v1_new) / g1)
 
     # Para p2 (mismo proceso)
     φ2 = p2.φ
-    r2 = radial_ellipse(φ2, a, b)
-    dr2_dφ = radial_derivative_ellipse(φ2, a, b)
-    g2 = metric_ellipse_polar(φ2, a, b)
-    dxdφ_mag2 = sqrt(g2)
+    _, tangent2 = cartesian_state_from_polar(φ2, one(T), a, b)
+    g2 = dot(tangent2, tangent2)
 
-    v2_new_mag = norm(v2_new)
-    φ_dot2_mag = v2_new_mag / dxdφ_mag2
-
-    s2, c2 = sincos(φ2)
-    tangent2 = SVector(dr2_dφ * c2 - r2 * s2, dr2_dφ * s2 + r2 * c2)
-    tangent2_normalized = tangent2 / norm(tangent2)
-
-    sign2 = sign(dot(v2_new, tangent2_normalized))
-    φ_dot2_new = sign2 * φ_dot2_mag
+    sign2 = sign(dot(v2_new, tangent2))
+    φ_dot2_new = sign2 * sqrt(dot(v2_new, v2_new) / g2)
 
     # Aplicar transporte paralelo si se solicita
     if method == :parallel_transport
@@ -354,6 +331,8 @@ Aproximación de primer orden: φᵢ(t) ≈ φᵢ₀ + φ̇ᵢ·t
 - `dt_max`: Tiempo máximo de búsqueda
 - `tol`: Tolerancia para convergencia (default: 1e-12)
 - `max_iter`: Máximo número de iteraciones (default: 50)
+- `perimeter`: Perímetro de la elipse, si ya se calculó (se usa en cada
+  evaluación de la distancia que da la vuelta por 0/2π)
 
 # Retorna
 - `t > 0` si habrá colisión dentro de dt_max
@@ -371,20 +350,26 @@ function time_to_collision_polar_intrinsic(
     b::T,
     dt_max::T;
     tol::T = T(1e-12),
-    max_iter::Int = 50
+    max_iter::Int = 50,
+    perimeter::T = ellipse_perimeter(a, b)
 ) where {T <: AbstractFloat}
 
     # Radio de colisión (suma de radios de las partículas)
     R_collision = p1.radius + p2.radius
 
+    # Constantes de la búsqueda: la bisección evalúa gap_function hasta
+    # max_iter + 3 veces
+    φ1_0, φ_dot1 = p1.φ, p1.φ_dot
+    φ2_0, φ_dot2 = p2.φ, p2.φ_dot
+
     # Función que evalúa: distancia_intrínseca(t) - R_collision
     function gap_function(t::T)
         # Posiciones angulares en tiempo t (aproximación lineal)
-        φ1_t = p1.φ + p1.φ_dot * t
-        φ2_t = p2.φ + p2.φ_dot * t
+        φ1_t = φ1_0 + φ_dot1 * t
+        φ2_t = φ2_0 + φ_dot2 * t
 
         # Distancia intrínseca (arc-length)
-        s = arc_length_between_periodic(φ1_t, φ2_t, a, b; method=:midpoint)
+        s = arc_length_between_periodic(φ1_t, φ2_t, a, b; method=:midpoint, perimeter=perimeter)
 
         return s - R_collision
     end
@@ -480,11 +465,15 @@ function find_next_collision_polar(
     i_min = 0
     j_min = 0
 
+    # El perímetro sólo depende de (a, b): una vez por búsqueda, no por par
+    perimeter = ellipse_perimeter(a, b)
+
     for i in 1:(N-1)
         for j in (i+1):N
             # Usar versión intrínseca o Euclidiana
             t = if intrinsic
-                time_to_collision_polar_intrinsic(particles[i], particles[j], a, b, dt_max)
+                time_to_collision_polar_intrinsic(particles[i], particles[j], a, b, dt_max;
+                                                  perimeter=perimeter)
             else
                 time_to_collision_polar(particles[i], particles[j], dt_max)
             end
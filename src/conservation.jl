@@ -127,9 +127,8 @@ function analyze_energy_conservation(data::ConservationData{T}) where {T <: Abst
     E_mean = mean(data.energies)
     E_std = std(data.energies)
 
-    # Error relativo máximo
-    rel_errors = abs.((data.energies .- E_initial) ./ E_initial)
-    max_rel_error = maximum(rel_errors)
+    # Error relativo máximo (una sola reducción, sin arreglos temporales)
+    max_rel_error = maximum(E -> abs((E - E_initial) / E_initial), data.energies)
 
     # Drift relativo
     rel_drift = (E_final - E_initial) / E_initial
@@ -179,10 +178,10 @@ function analyze_conjugate_momentum(data::ConservationData{T}) where {T <: Abstr
 
     if abs(P_initial) > eps(T)
         rel_error = abs(P_final - P_initial) / abs(P_initial)
-        max_rel_error = maximum(abs.((data.conjugate_momenta .- P_initial) ./ P_initial))
+        max_rel_error = maximum(P -> abs((P - P_initial) / P_initial), data.conjugate_momenta)
     else
         rel_error = abs(P_final - P_initial)
-        max_rel_error = maximum(abs.(data.conjugate_momenta))
+        max_rel_error = maximum(abs, data.conjugate_momenta)
     end
 
     return (
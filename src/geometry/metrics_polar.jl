@@ -97,6 +97,11 @@ En nuestra parametrización con φ como coordenada única:
 
     g_φφ = (dr/dφ)² + r²
 
+Con S = a²sin²φ + b²cos²φ y u = S'/S se tiene r² = a²b²/S y dr/dφ = -r·u/2,
+así que r y dr/dφ salen del mismo `sincos`:
+
+    g_φφ = r²(1 + u²/4)
+
 # Retorna
 - g_φφ(φ)
 
@@ -106,10 +111,13 @@ g = metric_ellipse_polar(π/4, 2.0, 1.0)
 ```
 """
 @inline function metric_ellipse_polar(φ::T, a::T, b::T) where {T <: Real}
-    r = radial_ellipse(φ, a, b)
-    dr_dφ = radial_derivative_ellipse(φ, a, b)
+    s, c = sincos(φ)
+    # Use abs() to handle tiny negative values from roundoff (~-1e-16)
+    S = abs(a^2 * s^2 + b^2 * c^2)
+    r² = (a * b)^2 / S
+    u = 2 * (a^2 - b^2) * s * c / S
 
-    return dr_dφ^2 + r^2
+    return r² * (1 + u^2 / 4)
 end
 
 """
@@ -158,19 +166,56 @@ Calcula ∂_φ g_φφ analíticamente.
 # Matemática
     g_φφ = (dr/dφ)² + r²
 
-    ∂_φ g_φφ = 2(dr/dφ)(d²r/dφ²) + 2r(dr/dφ)
+    ∂_φ g_φφ = 2r(dr/dφ) + 2(dr/dφ)(d²r/dφ²) = 2(dr/dφ)[r + d²r/dφ²]
+
+Con S = a²sin²φ + b²cos²φ, u = S'/S y S'' = 2(a² - b²)cos(2φ):
 
-Necesitamos d²r/dφ² (segunda derivada del radio).
+    dr/dφ   = -r·u/2
+    d²r/dφ² = r(3u²/4 - S''/(2S))
+
+    ∂_φ g_φφ = -r²·u·(1 + 3u²/4 - S''/(2S))
+
+Se evalúa con un solo `sincos`. Esta derivada entra en Γ^φ_φφ, que el
+integrador Forest-Ruth evalúa tres veces por partícula y paso.
 """
-function metric_derivative_polar(φ::T, a::T, b::T) where {T <: Real}
-    # Aproximación numérica usando diferencias finitas
-    # (Para implementación analítica completa, derivar d²r/dφ²)
+@inline function metric_derivative_polar(φ::T, a::T, b::T) where {T <: Real}
+    s, c = sincos(φ)
+    k = a^2 - b^2
+    # Use abs() to handle tiny negative values from roundoff (~-1e-16)
+    S = abs(a^2 * s^2 + b^2 * c^2)
+    r² = (a * b)^2 / S
 
-    h = sqrt(eps(T)) * max(one(T), abs(φ))
-    g_plus = metric_ellipse_polar(φ + h, a, b)
-    g_minus = metric_ellipse_polar(φ - h, a, b)
+    u = 2 * k * s * c / S
+    S_dd = 2 * k * (c^2 - s^2)
 
-    return (g_plus - g_minus) / (2 * h)
+    return -r² * u * (1 + T(0.75) * u^2 - S_dd / (2 * S))
+end
+
+# ============================================================================
+# Evaluación por lotes
+# ============================================================================
+
+# Número de elementos a partir del cual las versiones por lotes reparten el
+# arreglo entre hilos; por debajo domina el costo de lanzar las tareas
+const BATCH_THREADED_MIN_ELEMENTS = 50_000
+
+# Aplica `kernel(k)` a cada índice de `inds`, en bloques contiguos por hilo
+# cuando el arreglo es grande. Cada índice escribe sólo su propia salida.
+function _foreach_batched(kernel, inds)
+    n = length(inds)
+    if Threads.nthreads() == 1 || n < BATCH_THREADED_MIN_ELEMENTS
+        for k in inds
+            kernel(k)
+        end
+    else
+        blocks = collect(Iterators.partition(inds, cld(n, Threads.nthreads())))
+        Threads.@threads for block in blocks
+            for k in block
+                kernel(k)
+            end
+        end
+    end
+    return nothing
 end
 
 # ============================================================================
@@ -191,6 +236,95 @@ Convierte ángulo polar φ a coordenadas cartesianas (x, y).
     return SVector(r * c, r * s)
 end
 
+"""
+    cartesian_from_polar_angles(φs, a, b)
+
+Versión por lotes de `cartesian_from_polar_angle` para un arreglo de ángulos
+de cualquier forma (p.ej. la matriz `(n_snapshots, N)` de `trajectories/phi`).
+
+Recorre el arreglo una sola vez evaluando `sincos(φ)` y r(φ) por elemento, sin
+crear un `SVector` por punto ni arreglos intermedios para r, cos y sin.
+
+# Argumentos opcionales
+- `precision`: Tipo de punto flotante del cálculo y de la salida (default: el
+  tipo promovido de `φs`, `a` y `b`). `precision=Float32` basta para arreglos
+  que sólo se grafican y reduce a la mitad la memoria de `(x, y)`.
+
+# Retorna
+- `(x, y)`: Arreglos con la misma forma que `φs`
+
+# Ejemplo
+```julia
+x, y = cartesian_from_polar_angles(phi, a, b)  # phi: (n_snapshots, N)
+x, y = cartesian_from_polar_angles(phi, a, b; precision=Float32)  # para graficar
+```
+"""
+function cartesian_from_polar_angles(
+    φs::AbstractArray{<:Real}, a::Real, b::Real;
+    precision::Type{<:AbstractFloat} = float(promote_type(eltype(φs), typeof(a), typeof(b)))
+)
+    T = precision
+    a_T, b_T = T(a), T(b)
+    a², b², ab = a_T^2, b_T^2, a_T * b_T
+
+    x = similar(φs, T)
+    y = similar(φs, T)
+
+    _foreach_batched(eachindex(φs, x, y)) do k
+        @inbounds begin
+            s, c = sincos(T(φs[k]))
+            r = ab / sqrt(abs(a² * s^2 + b² * c^2))
+            x[k] = r * c
+            y[k] = r * s
+        end
+    end
+
+    return x, y
+end
+
+"""
+    physical_speeds_polar(φs, φ_dots, a, b)
+
+Rapidez física |v| = √g_φφ(φ)·|φ̇| evaluada elemento a elemento sobre arreglos
+de ángulos y velocidades angulares de la misma forma (p.ej. las matrices
+`(n_snapshots, N)` de `trajectories/phi` y `trajectories/phidot`).
+
+Usa una sola evaluación de `sincos(φ)` por elemento y escribe directamente en
+el arreglo de salida, sin construir el vector de métricas intermedio.
+
+Acepta cualquier arreglo de CPU (incluidas vistas como `view(phi, :, idx)`);
+`φs` y `φ_dots` deben tener los mismos ejes.
+
+# Retorna
+- Arreglo con la misma forma que `φs`
+
+# Ejemplo
+```julia
+v = physical_speeds_polar(phi, phidot, a, b)  # phi, phidot: (n_snapshots, N)
+```
+"""
+function physical_speeds_polar(φs::AbstractArray{<:Real}, φ_dots::AbstractArray{<:Real},
+                               a::Real, b::Real)
+    T = float(promote_type(eltype(φs), eltype(φ_dots), typeof(a), typeof(b)))
+    a_T, b_T = T(a), T(b)
+    a², b² = a_T^2, b_T^2
+    a²b², Δ = a² * b², a² - b²
+
+    v = similar(φs, T)
+
+    _foreach_batched(eachindex(φs, φ_dots, v)) do k
+        @inbounds begin
+            s, c = sincos(T(φs[k]))
+            S = abs(a² * s^2 + b² * c^2)
+            u = 2 * Δ * s * c / S
+            g = (a²b² / S) * (1 + u^2 / 4)
+            v[k] = sqrt(g) * abs(T(φ_dots[k]))
+        end
+    end
+
+    return v
+end
+
 """
     velocity_from_polar_angular(φ, φ_dot, a, b)
 
@@ -214,6 +348,32 @@ Convierte velocidad angular φ̇ a velocidad cartesiana (vx, vy).
     return SVector(vx, vy)
 end
 
+"""
+    cartesian_state_from_polar(φ, φ_dot, a, b)
+
+Posición y velocidad cartesianas en una sola evaluación de la curva.
+
+Equivale a `(cartesian_from_polar_angle(φ, a, b), velocity_from_polar_angular(φ, φ_dot, a, b))`,
+pero comparte un único `sincos(φ)` y S = a²sin²φ + b²cos²φ entre r, dr/dφ y
+ambos vectores (usando dr/dφ = -r(a² - b²)sinφ·cosφ/S). Las llamadas por
+separado evalúan la trigonometría cuatro veces por partícula.
+
+# Retorna
+- `(pos, vel)`: Tupla de `SVector{2}`
+"""
+@inline function cartesian_state_from_polar(φ::T, φ_dot::T, a::T, b::T) where {T <: Real}
+    s, c = sincos(φ)
+    # Use abs() to handle tiny negative values from roundoff (~-1e-16)
+    S = abs(a^2 * s^2 + b^2 * c^2)
+    r = a * b / sqrt(S)
+    dr_dφ = -r * (a^2 - b^2) * s * c / S
+
+    pos = SVector(r * c, r * s)
+    vel = SVector((dr_dφ * c - r * s) * φ_dot, (dr_dφ * s + r * c) * φ_dot)
+
+    return pos, vel
+end
+
 # ============================================================================
 # Energía cinética
 # ============================================================================
@@ -250,28 +410,94 @@ Para una curva en polares r(φ):
 
     κ = |r² + 2(dr/dφ)² - r(d²r/dφ²)| / (r² + (dr/dφ)²)^(3/2)
 
+Las tres derivadas salen de un solo `sincos` (como en
+[`metric_derivative_polar`](@ref)): con S = a²sin²φ + b²cos²φ, u = S'/S,
+
+    dr/dφ = -r·u/2,    d²r/dφ² = r(3u²/4 - S''/(2S))
+
+y sustituyendo
+
+    κ = |1 - u²/4 + S''/(2S)| / (r·(1 + u²/4)^(3/2))
+
+Para el círculo (a = b) devuelve directamente κ = 1/a.
+
 # Retorna
 - κ(φ): Curvatura en el punto φ
 """
-function curvature_ellipse_polar(φ::T, a::T, b::T) where {T <: Real}
-    r = radial_ellipse(φ, a, b)
+@inline function curvature_ellipse_polar(φ::T, a::T, b::T) where {T <: Real}
+    # Círculo: curvatura constante
+    a == b && return one(T) / a
 
-    # Primera derivada
-    dr_dφ = radial_derivative_ellipse(φ, a, b)
+    s, c = sincos(φ)
+    k = a^2 - b^2
+    # Use abs() to handle tiny negative values from roundoff (~-1e-16)
+    S = abs(a^2 * s^2 + b^2 * c^2)
+    r = a * b / sqrt(S)
 
-    # Segunda derivada (numérica por ahora)
-    h = sqrt(eps(T)) * max(one(T), abs(φ))
-    dr_plus = radial_derivative_ellipse(φ + h, a, b)
-    dr_minus = radial_derivative_ellipse(φ - h, a, b)
-    d2r_dφ2 = (dr_plus - dr_minus) / (2 * h)
+    u² = (2 * k * s * c / S)^2
+    S_dd = 2 * k * (c^2 - s^2)
 
-    # Curvatura
-    numerator = abs(r^2 + 2 * dr_dφ^2 - r * d2r_dφ2)
-    denominator = (r^2 + dr_dφ^2)^(3/2)
+    numerator = abs(1 - u² / 4 + S_dd / (2 * S))
+    denominator = r * (1 + u² / 4)^(3/2)
 
     return numerator / denominator
 end
 
+"""
+    curvature_and_metric_polar(φ, a, b)
+
+Curvatura κ(φ) y métrica g_φφ(φ) de una sola evaluación.
+
+Ambas comparten S, r y u (ver [`curvature_ellipse_polar`](@ref) y
+[`metric_ellipse_polar`](@ref)): g_φφ = r²(1 + u²/4), así que el par cuesta un
+`sincos` en lugar de dos. Pensada para muestrear κ y g sobre muchos ángulos,
+p. ej. `curvature_and_metric_polar.(φs, a, b)`.
+
+# Retorna
+- `(κ, g_φφ)`
+"""
+@inline function curvature_and_metric_polar(φ::T, a::T, b::T) where {T <: Real}
+    # Círculo: curvatura y métrica constantes
+    a == b && return (one(T) / a, a^2)
+
+    s, c = sincos(φ)
+    k = a^2 - b^2
+    # Use abs() to handle tiny negative values from roundoff (~-1e-16)
+    S = abs(a^2 * s^2 + b^2 * c^2)
+    r = a * b / sqrt(S)
+
+    u² = (2 * k * s * c / S)^2
+    S_dd = 2 * k * (c^2 - s^2)
+    q = 1 + u² / 4
+
+    κ = abs(1 - u² / 4 + S_dd / (2 * S)) / (r * q^(3/2))
+
+    return (κ, r^2 * q)
+end
+
+"""
+    curvatures_polar(φs, a, b)
+
+Versión por lotes de [`curvature_ellipse_polar`](@ref) para un arreglo de
+ángulos de cualquier forma. Para arreglos grandes reparte el trabajo entre
+hilos (ver `Threads.nthreads()`).
+
+# Retorna
+- Arreglo de κ(φ) con la misma forma que `φs`
+"""
+function curvatures_polar(φs::AbstractArray{<:Real}, a::Real, b::Real)
+    T = float(promote_type(eltype(φs), typeof(a), typeof(b)))
+    a_T, b_T = T(a), T(b)
+
+    κ = similar(φs, T)
+
+    _foreach_batched(eachindex(φs, κ)) do k
+        @inbounds κ[k] = curvature_ellipse_polar(T(φs[k]), a_T, b_T)
+    end
+
+    return κ
+end
+
 # ============================================================================
 # Longitud de arco (geometría intrínseca)
 # ============================================================================
@@ -326,17 +552,19 @@ function arc_length_between(
         return abs(φ2 - φ1) * sqrt(abs(g_mid))
 
     elseif method == :trapezoidal
-        # Regla del trapecio
+        # Regla del trapecio, acumulada en un solo recorrido (sin arreglos
+        # temporales para φ, g(φ) ni el integrando)
         n_points = max(10, ceil(Int, abs(φ2 - φ1) * 50))
-        φ_vals = range(φ1, φ2, length=n_points)
+        h = (φ2 - φ1) / (n_points - 1)
 
         # Use abs() for numerical safety (metric should always be positive)
-        integrand = sqrt.(abs.(metric_ellipse_polar.(φ_vals, a, b)))
+        integrand(φ) = sqrt(abs(metric_ellipse_polar(φ, a, b)))
 
-        # Trapecio
-        h = (φ2 - φ1) / (n_points - 1)
-        s = h * (integrand[1]/2 + sum(integrand[2:end-1]) + integrand[end]/2)
-        return s
+        s = (integrand(φ1) + integrand(φ2)) / 2
+        for k in 1:(n_points - 2)
+            s += integrand(φ1 + k * h)
+        end
+        return h * s
 
     else
         error("Método desconocido: $method. Use :midpoint o :trapezoidal")
@@ -377,12 +605,21 @@ Calcula la longitud de arco considerando periodicidad (camino más corto).
 Para partículas en una elipse cerrada, puede ser más corto ir en dirección
 opuesta si los ángulos están cerca de 0/2π.
 
+`perimeter` permite pasar el perímetro ya calculado (p. ej. desde una búsqueda
+de colisiones que evalúa esta función muchas veces); si es `nothing` se
+calcula con `ellipse_perimeter` cuando se necesita el camino envolvente.
+
+# Caso círculo
+Si a = b la métrica es constante (g_φφ = a²) y la longitud es exactamente
+a·min(Δφ, 2π - Δφ): se devuelve sin cuadratura ni perímetro.
+
 # Retorna
 - Longitud de arco del camino más corto
 """
 function arc_length_between_periodic(
     φ1::T, φ2::T, a::T, b::T;
-    method::Symbol=:midpoint
+    method::Symbol=:midpoint,
+    perimeter::Union{Nothing, T}=nothing
 ) where {T <: Real}
 
     # Normalizar ángulos
@@ -393,6 +630,11 @@ function arc_length_between_periodic(
     Δφ_direct = abs(φ2_norm - φ1_norm)
     Δφ_wrap = 2π - Δφ_direct
 
+    # Círculo: forma cerrada
+    if a == b
+        return a * min(Δφ_direct, Δφ_wrap)
+    end
+
     # Calcular longitud en ambas direcciones
     if Δφ_direct <= Δφ_wrap
         # Camino directo es más corto
@@ -400,9 +642,9 @@ function arc_length_between_periodic(
     else
         # Camino envolvente es más corto
         # Perímetro total menos el arco directo
-        perimeter = ellipse_perimeter(a, b)
+        P = perimeter === nothing ? ellipse_perimeter(a, b) : perimeter
         s_direct = arc_length_between(φ1_norm, φ2_norm, a, b; method=method)
-        return perimeter - s_direct
+        return P - s_direct
     end
 end
 
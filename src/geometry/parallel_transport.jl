@@ -32,8 +32,10 @@ La solución es:
 v(θ_final) = v(θ_initial) exp(-∫[θ_initial → θ_final] Γ(s) ds)
 ```
 
-Para la elipse, debemos integrar numéricamente ya que la integral de Γ(θ)
-no tiene forma cerrada simple.
+Como Γ = ∂g/(2g), la integral tiene forma cerrada:
+```
+∫ Γ dθ = ½ ln(g(θ_final)/g(θ_initial))   ⇒   v(θ_final) = v(θ_initial) √(g(θ_initial)/g(θ_final))
+```
 
 # Parámetros
 - `v_old`: Velocidad angular en θ_initial
@@ -45,13 +47,9 @@ no tiene forma cerrada simple.
 - `v_new`: Velocidad angular transportada a θ_final
 
 # Método
-Integramos la EDO usando **Runge-Kutta 4** (RK4) de 4to orden.
-
-**Nota sobre Forest-Ruth:**
-Forest-Ruth es ideal para sistemas Hamiltonianos separables (H = T + V),
-como las ecuaciones geodésicas. Sin embargo, la EDO de transporte paralelo
-dv/dθ = -Γ(θ) v(θ) NO es un sistema Hamiltoniano separable, por lo que
-RK4 es más apropiado aquí. Forest-Ruth se usa para las geodésicas.
+Se evalúa la solución exacta con dos evaluaciones de la métrica, en lugar de
+integrar la EDO con RK4 (≥ 10 pasos, 4 evaluaciones de Γ por paso). El resultado
+es exacto para cualquier Δθ y conserva g·v² (norma métrica) a precisión de máquina.
 """
 @inline function parallel_transport_velocity(
     v_old::T, θ_initial::T, θ_final::T, a::T, b::T
@@ -63,41 +61,8 @@ RK4 es más apropiado aquí. Forest-Ruth se usa para las geodésicas.
         return v_old
     end
 
-    # Para desplazamientos muy pequeños, usar aproximación lineal
-    if abs(Δθ_total) < T(1e-6)
-        Γ = christoffel_ellipse(θ_initial, a, b)
-        return v_old - Γ * v_old * Δθ_total
-    end
-
-    # Para desplazamientos grandes, integrar la EDO usando RK4
-    # dv/dθ = -Γ(θ) v(θ)
-
-    # Número de pasos adaptativos
-    n_steps = max(10, Int(ceil(abs(Δθ_total) / T(0.1))))
-    dθ = Δθ_total / n_steps
-
-    θ = θ_initial
-    v = v_old
-
-    for _ in 1:n_steps
-        # RK4 para dv/dθ = -Γ(θ) v
-        Γ1 = christoffel_ellipse(θ, a, b)
-        k1 = -Γ1 * v
-
-        Γ2 = christoffel_ellipse(θ + dθ/2, a, b)
-        k2 = -Γ2 * (v + k1 * dθ/2)
-
-        Γ3 = christoffel_ellipse(θ + dθ/2, a, b)
-        k3 = -Γ3 * (v + k2 * dθ/2)
-
-        Γ4 = christoffel_ellipse(θ + dθ, a, b)
-        k4 = -Γ4 * (v + k3 * dθ)
-
-        v = v + (k1 + 2*k2 + 2*k3 + k4) * dθ / 6
-        θ = θ + dθ
-    end
-
-    return v
+    # Solución exacta de dv/dθ = -Γ v con Γ = ∂g/(2g)
+    return v_old * sqrt(metric_ellipse(θ_initial, a, b) / metric_ellipse(θ_final, a, b))
 end
 
 """
@@ -77,8 +77,10 @@ function save_trajectories_hdf5(filename::String, data; compress=true)
             pos_y_array[i, j] = p.pos[2]
             vel_x_array[i, j] = p.vel[1]
             vel_y_array[i, j] = p.vel[2]
-            energy_array[i, j] = kinetic_energy_polar(p.φ, p.φ_dot, p.mass, a, b)
-            momentum_array[i, j] = conjugate_momentum(p, a, b)
+
+            # E = ½ m g φ̇² and p_φ = m g φ̇ share g_φφ: evaluate the metric once
+            momentum_array[i, j] = p.mass * metric_ellipse_polar(p.φ, a, b) * p.φ_dot
+            energy_array[i, j] = 0.5 * momentum_array[i, j] * p.φ_dot
         end
     end
 
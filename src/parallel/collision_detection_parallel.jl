@@ -130,6 +130,28 @@ function find_next_collision_parallel(
     max_time::T = T(Inf),
     min_dt::T = T(1e-10)
 ) where {T <: AbstractFloat}
+    n = length(particles)
+    return find_next_collision_parallel!(Vector{T}(undef, n), Vector{T}(undef, n), Vector{T}(undef, n),
+                                         particles, a, b; max_time=max_time, min_dt=min_dt)
+end
+
+"""
+    find_next_collision_parallel!(φs, φ_dots, radii, particles, a, b; max_time=Inf, min_dt=1e-10)
+
+Versión de [`find_next_collision_parallel`](@ref) con buffers SoA provistos
+por el llamador (ver [`find_next_collision!`](@ref)). Los threads leen sólo
+los arreglos contiguos `φs`, `φ_dots` y `radii`, no los `Particle` completos.
+"""
+function find_next_collision_parallel!(
+    φs::AbstractVector{T},
+    φ_dots::AbstractVector{T},
+    radii::AbstractVector{T},
+    particles::Vector{Particle{T}},
+    a::T,
+    b::T;
+    max_time::T = T(Inf),
+    min_dt::T = T(1e-10)
+) where {T <: AbstractFloat}
 
     n = length(particles)
     n_pairs = div(n * (n - 1), 2)
@@ -139,9 +161,13 @@ function find_next_collision_parallel(
     # Break-even: necesitamos ~250 pares = N≈23 partículas
     # Usamos N<50 como umbral conservador para asegurar beneficio
     if n < 50 || nthreads() == 1
-        return find_next_collision(particles, a, b; max_time=max_time, min_dt=min_dt)
+        return find_next_collision!(φs, φ_dots, radii, particles, a, b;
+                                    max_time=max_time, min_dt=min_dt)
     end
 
+    # Estado SoA compartido (sólo lectura) por todos los threads
+    _collision_state_soa!(φs, φ_dots, radii, particles)
+
     # Thread-local storage para mínimos
     # Cada thread mantiene su propio candidato a mínimo
     # IMPORTANTE: Usar maxthreadid() en vez de nthreads() para evitar BoundsError
@@ -160,7 +186,7 @@ function find_next_collision_parallel(
         # Calcular tiempo a colisión para este par
         # @inbounds seguro aquí: i,j garantizados en 1:n
         @inbounds t_coll = time_to_collision(
-            particles[i], particles[j], a, b;
+            φs[i], φ_dots[i], φs[j], φ_dots[j], radii[i] + radii[j], a, b;
             max_time = max_time
         )
 
@@ -233,6 +259,12 @@ function find_next_collision_parallel_dynamic(
         return find_next_collision(particles, a, b; max_time=max_time, min_dt=min_dt)
     end
 
+    # Estado SoA compartido (sólo lectura) por todos los threads
+    φs = Vector{T}(undef, n)
+    φ_dots = Vector{T}(undef, n)
+    radii = Vector{T}(undef, n)
+    _collision_state_soa!(φs, φ_dots, radii, particles)
+
     # IMPORTANTE: Usar maxthreadid() en vez de nthreads() para evitar BoundsError
     max_tid = Threads.maxthreadid()
     t_mins = fill(max_time, max_tid)
@@ -243,8 +275,8 @@ function find_next_collision_parallel_dynamic(
     @threads :dynamic for idx in 1:n_pairs
         i, j = linear_to_pair(idx, n)
 
-        t_coll = time_to_collision(
-            particles[i], particles[j], a, b;
+        @inbounds t_coll = time_to_collision(
+            φs[i], φ_dots[i], φs[j], φ_dots[j], radii[i] + radii[j], a, b;
             max_time = max_time
         )
 
@@ -67,11 +67,8 @@ function ParticlePolar(
     b::T
 ) where {T <: AbstractFloat}
 
-    # Calcular posiciones cartesianas
-    pos = cartesian_from_polar_angle(φ, a, b)
-
-    # Calcular velocidades cartesianas
-    vel = velocity_from_polar_angular(φ, φ_dot, a, b)
+    # Calcular posiciones y velocidades cartesianas
+    pos, vel = cartesian_state_from_polar(φ, φ_dot, a, b)
 
     return ParticlePolar{T}(Int32(id), mass, radius, φ, φ_dot, pos, vel)
 end
@@ -115,9 +112,8 @@ function update_particle_polar(
     # Normalizar φ a [0, 2π)
     φ_normalized = mod(φ_new, 2π)
 
-    # Calcular nuevas posiciones y velocidades cartesianas
-    pos_new = cartesian_from_polar_angle(φ_normalized, a, b)
-    vel_new = velocity_from_polar_angular(φ_normalized, φ_dot_new, a, b)
+    # Calcular nuevas posiciones y velocidades cartesianas (un solo sincos)
+    pos_new, vel_new = cartesian_state_from_polar(φ_normalized, φ_dot_new, a, b)
 
     return ParticlePolar(
         p.id, p.mass, p.radius,
@@ -158,11 +154,17 @@ end
 
 Calcula momento angular: L = m r² φ̇
 
+Se evalúa como el producto cruz 2D de los vectores cartesianos ya guardados
+en la partícula, L = m (x·v_y - y·v_x), que es idéntico a m r² φ̇ (la
+componente radial de la velocidad no contribuye) y no requiere `sincos`
+ni raíz.
+
 NOTA: Esto tampoco se conserva en general para la elipse.
 """
 function angular_momentum(p::ParticlePolar{T}, a::T, b::T) where {T <: AbstractFloat}
-    r = radial_ellipse(p.φ, a, b)
-    return p.mass * r^2 * p.φ_dot
+    x, y = p.pos
+    vx, vy = p.vel
+    return p.mass * (x * vy - y * vx)
 end
 
 # ============================================================================
@@ -203,6 +205,7 @@ function generate_random_particles_polar(
 ) where {T <: AbstractFloat}
 
     particles = ParticlePolar{T}[]
+    sizehint!(particles, N)
 
     for id in 1:N
         placed = false
@@ -211,26 +214,25 @@ function generate_random_particles_polar(
             # Ángulo polar aleatorio
             φ = T(2π * rand(rng))
 
-            # Velocidad angular aleatoria
+            # Velocidad angular aleatoria (se sortea siempre, para no alterar
+            # la secuencia del rng respecto a semillas ya usadas)
             φ_dot = T(max_speed * (2 * rand(rng) - 1))
 
-            # Crear partícula candidata
-            candidate = ParticlePolar(id, mass, radius, φ, φ_dot, a, b)
-
             # Verificar que no se solape con partículas existentes
-            # Usa distancia INTRÍNSECA (longitud de arco geodésica)
+            # Usa distancia INTRÍNSECA (longitud de arco geodésica); sólo
+            # depende de φ, así que la partícula se construye al aceptarla
             no_overlap = true
             for p in particles
                 # Longitud de arco entre partículas
-                s = arc_length_between_periodic(candidate.φ, p.φ, a, b; method=:midpoint)
-                if s < (candidate.radius + p.radius)
+                s = arc_length_between_periodic(φ, p.φ, a, b; method=:midpoint)
+                if s < (radius + p.radius)
                     no_overlap = false
                     break
                 end
             end
 
             if no_overlap
-                push!(particles, candidate)
+                push!(particles, ParticlePolar(id, mass, radius, φ, φ_dot, a, b))
                 placed = true
                 break
             end
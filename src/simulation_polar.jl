@@ -147,7 +147,8 @@ function simulate_ellipse_polar_adaptive(
 
     # Inicializar estructuras de datos con PREALLOCACIÓN
     expected_saves = ceil(Int, max_time / save_interval) + 100
-    expected_steps = ceil(Int, max_time / dt_max) * 2 + 10000
+    # Cota inferior (dt ≤ dt_max); los pasos extra se añaden con resize!
+    expected_steps = ceil(Int, max_time / dt_max) + 10000
 
     particles_history = Vector{Vector{ParticlePolar{T}}}(undef, expected_saves)
     times_saved = Vector{T}(undef, expected_saves)
@@ -296,6 +297,10 @@ function simulate_ellipse_polar_adaptive(
     resize!(dt_history, step_idx)
     resize!(n_collisions_vec, step_idx)
 
+    # resize! no libera capacidad: devolver el exceso reservado
+    sizehint!(dt_history, step_idx)
+    sizehint!(n_collisions_vec, step_idx)
+
     if verbose
         println("=" ^ 70)
         println("SIMULACIÓN COMPLETADA")